@@ -1,62 +1,272 @@
 import importlib
 import os
-from Strategy import StrategyBase, StrategyHelper
-from random import randint
+import random
+import time
+import traceback
+from collections import namedtuple
+import numpy as np
+from Distributions import get_distribution
+from Checkpoint import CheckpointWriter, read_checkpoint
+from EventLog import EventLogWriter
+from Settlement import top_two, settle
+from Strategy import StrategyBase, StrategyHelper, RoundHistory, timing_report, print_timing_report
+from Workers import StrategyWorker, collect_bids
+
+# One settled round, as yielded by Auction.iter_rounds. values and bids are aligned with `active`, the indices
+# of the bots that took part; capitals is a snapshot of every bot's capital after settlement.
+RoundRecord = namedtuple('RoundRecord', ['round', 'active', 'values', 'bids', 'winning_bid', 'second_highest', 'capitals'])
+
+# A problem caught with contain_faults=True. bot is None when the failure ended the whole run.
+Failure = namedtuple('Failure', ['round', 'bot', 'kind', 'detail'])
+
+class AuctionAborted(Exception):
+    # Raised inside a contained run when a round can't be settled; iter_rounds ends the run on it
+    pass
+
+class BrokenStrategy(StrategyBase):
+    # Stands in for a strategy whose constructor raised in a contained run; it is disqualified before round 1
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        raise RuntimeError("strategy could not be constructed")
+
+def load_strategy_class(strategy_folder, module_name):
+    # StrategyBase subclasses defined in one strategy module
+    module = importlib.import_module(f"{strategy_folder}.{module_name}")
+    classes = []
+    for attr in dir(module):
+        obj = getattr(module, attr)
+        if isinstance(obj, type) and issubclass(obj, StrategyBase) and obj is not StrategyBase:
+            classes.append(obj)
+    return classes
+
+def load_strategy_classes(strategy_folder):
+    # (module name, StrategyBase subclass) for every strategy in the folder. A list of such pairs is used as is,
+    # which lets callers such as Benchmark.py run bots that don't live in a folder.
+    if not isinstance(strategy_folder, str):
+        return list(strategy_folder)
+    classes = []
+    for file in sorted(os.listdir(strategy_folder)):  # sorted so seeded runs replay identically everywhere
+        if file.endswith('.py'):
+            module_name = file[:-3]  # removes '.py' extension
+            classes.extend((module_name, obj) for obj in load_strategy_class(strategy_folder, module_name))
+    return classes
 
 
 class Auction:
 
-    def __init__(self, strategy_folder, round_count, starting_capital, max_value, second_highest_fraction, type='self', log=False):
+    def __init__(self, strategy_folder, round_count, starting_capital, max_value, second_highest_fraction, type='self', log=False, info_size=100, verbose=True, seed=None, prefetch_values=False, distribution='uniform', event_log=None, workers=False, deadline=1.0, checkpoint=None, checkpoint_interval=60.0, contain_faults=False, time_limit=None, memory_limit=None, time_strikes=3, memory_check_interval=100):
         self.__strategy_folder = strategy_folder  # path where all strategy submissions are located
         self.round_count = round_count  # number of rounds
         self.__round_number = 0
         self.starting_capital = starting_capital
         self.max_value = max_value
+        self.distribution = get_distribution(distribution, max_value)  # name or Distribution that values are drawn from
+        self.__distribution_name = distribution if isinstance(distribution, str) else None
         self.type = type
         self.__dead_strategies = 0
         self.log = log
+        self.event_log = event_log  # path of a binary event log (see EventLog.py); much cheaper than log=True
+        self.__event_log = None
+        self.__event_log_started = None  # path the header was written to; iter_rounds called again appends to it
+        self.verbose = verbose  # print final profits at the end of simulate()
         self.second_highest_fraction = second_highest_fraction
+        self.info_size = info_size  # number of past rounds visible to strategies
+        self.__history = RoundHistory(info_size, max_value=max_value, shared=workers)  # winning / second-highest bids, shared by every strategy
+        self.seed = seed
+        # Independent streams for value drawing and for each strategy, all derived from one seed
+        self.__seed_sequence = np.random.SeedSequence(seed)
+        self.__rng = np.random.default_rng(self.__seed_sequence.spawn(1)[0])
+        if seed is not None:
+            # Strategies still using the global random / numpy state get a reproducible stream too
+            random.seed(int(self.__seed_sequence.generate_state(1)[0]))
+            np.random.seed(self.__seed_sequence.generate_state(1)[0])
+        # Draw values for many rounds at once as a (rounds x bots) matrix instead of once per round
+        self.prefetch_values = prefetch_values
+        self.__value_block = np.empty((0, 0), dtype=int)
+        self.__value_row = 0
+        # Host every strategy in its own process; bids are requested concurrently and gathered within `deadline` seconds a round
+        self.workers = workers
+        self.deadline = deadline
+        # Snapshot the whole simulation to `checkpoint` every `checkpoint_interval` seconds; continue with Auction.resume
+        if checkpoint is not None and workers:
+            raise ValueError("Auctions with strategy workers can't be checkpointed")
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.__checkpoint_writer = None
+        self.__last_checkpoint = None
+        # Disqualify bots whose make_bid raises or returns None / NaN instead of ending the run, and end a run that
+        # can't be settled with status 'aborted' instead of exit(1). Problems are collected in self.failures.
+        self.contain_faults = contain_faults
+        self.failures = []
+        self.status = 'running'
+        self.__faulted = []  # positions in this round's active array of bots that faulted
+        # Budgets: a make_bid call over `time_limit` seconds has its bid thrown out, and the bot is disqualified on its
+        # `time_strikes`-th such call. A bot using more than `memory_limit` bytes (its worker's RSS growth since round 1,
+        # or the estimated size of the strategy object in process), checked every `memory_check_interval` rounds, is
+        # disqualified.
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
+        self.time_strikes = time_strikes
+        self.memory_check_interval = memory_check_interval
+        self.__broken = []  # (index, traceback) of strategies whose constructor raised in a contained run
         self.__load_strategies(self.starting_capital, self.max_value)
-        self.capitals = [starting_capital for _ in self.__strategies]
+        self.capitals = np.full(len(self.__strategies), float(starting_capital))  # settled in place each round
+        for i, strategy in enumerate(self.__strategies):
+            strategy.bind_capital(self.capitals, i)
+        self.__notified = np.array([strategy.has_round_callback for strategy in self.__strategies], dtype=bool)  # bots with on_round_result
+        self.__active = np.flatnonzero(self.capitals > 0)  # bots with capital left, in order; shrinks only when a bot dies
+        self.disqualified = np.zeros(len(self.__strategies), dtype=bool)
+        self.__strikes = np.zeros(len(self.__strategies), dtype=int)  # make_bid calls over time_limit
         self.final_profits = [0 for _ in self.__strategies]
-        self.simulate()
+        self.run_time = 0.0  # wall time spent in run_auction, in seconds
+        if self.__broken:
+            self.failures += [Failure(0, self.__strategies[i].name, 'exception', detail) for i, detail in self.__broken]
+            self.__disqualify(np.array([i for i, _ in self.__broken]))
 
     def __load_strategies(self, starting_capital, max_value):
         self.__strategies = []
-        for file in os.listdir(self.__strategy_folder):
-            if file.endswith('.py'):
-                module_name = file[:-3]  # removes '.py' extension
-                module = importlib.import_module(f"{self.__strategy_folder}.{module_name}")
-                for attr in dir(module):
-                    obj = getattr(module, attr)
-                    if isinstance(obj, type) and issubclass(obj, StrategyBase) and obj is not StrategyBase:
-                        self.__strategies.append(StrategyHelper(module_name, obj(), starting_capital, max_value, second_highest_fraction=self.second_highest_fraction, log=self.log))
-
-    def __pick_from_distribution(self):
-        # Picks a random number from distribution of our choice
-        return randint(0, 100)
-
-    def __get_values(self):
-        self.values = [self.__pick_from_distribution() for _ in range(len(self.__strategies)) if self.__strategies[_].capital > 0]
+        for module_name, strategy_class in load_strategy_classes(self.__strategy_folder):
+            seed_sequence = self.__seed_sequence.spawn(1)[0]
+            if self.workers:
+                helper_args = dict(starting_capital=starting_capital, max_value=max_value, second_highest_fraction=self.second_highest_fraction, info_size=self.info_size)
+                self.__strategies.append(StrategyHelper(module_name, StrategyWorker(module_name, strategy_class, helper_args, seed_sequence, self.__history.descriptor()), starting_capital, max_value, second_highest_fraction=self.second_highest_fraction, log=self.log, info_size=self.info_size, history=self.__history))
+            else:
+                self.__strategies.append(StrategyHelper(module_name, self.__construct(strategy_class), starting_capital, max_value, second_highest_fraction=self.second_highest_fraction, log=self.log, info_size=self.info_size, history=self.__history, rng=np.random.default_rng(seed_sequence)))
+
+    def __construct(self, strategy_class):
+        if not self.contain_faults:
+            return strategy_class()
+        try:
+            return strategy_class()
+        except Exception:
+            self.__broken.append((len(self.__strategies), traceback.format_exc()))
+            return BrokenStrategy()
+
+    def __notify(self, indices, winning_bid, second_highest):
+        # on_round_result for the given bots. In a contained run, returns the bots whose callback raised, to be
+        # disqualified once the round is settled.
+        if not self.contain_faults:
+            for i in indices:
+                self.__strategies[i].notify(winning_bid, second_highest)
+            return []
+        faulted = []
+        for i in indices:
+            try:
+                self.__strategies[i].notify(winning_bid, second_highest)
+            except Exception:
+                self.failures.append(Failure(self.__round_number, self.__strategies[i].name, 'exception', traceback.format_exc()))
+                faulted.append(i)
+        return faulted
+
+    def __pick_from_distribution(self, size):
+        # Picks an array of `size` random numbers from distribution of our choice
+        return self.distribution.sample(self.__rng, size)
+
+    def __get_values(self, active):
+        if not self.prefetch_values:
+            self.values = self.__pick_from_distribution(len(active)).tolist()
+            return self.values
+        if self.__value_row == len(self.__value_block):
+            # Next block of rounds, capped at ~1M values so long runs don't hold the whole matrix in memory
+            rounds = min(self.round_count - self.__round_number + 1, max(1, 2**20 // len(self.__strategies)))
+            self.__value_block = self.__pick_from_distribution((rounds, len(self.__strategies)))
+            self.__value_row = 0
+        # Every bot has a column; values for bots that are out of capital are drawn but skipped
+        self.values = self.__value_block[self.__value_row, active].tolist()
+        self.__value_row += 1
         return self.values
 
-    def __get_bids(self):
-        return [(strategy.bid(value, len(self.__strategies) - self.__dead_strategies), strategy) for strategy, value in zip([strategy for strategy in self.__strategies if strategy.capital > 0], self.values) if strategy.capital > 0]
+    def __get_bids(self, active):
+        num_bidders = len(active)
+        if self.workers:
+            bids = collect_bids([self.__strategies[i] for i in active], self.values, num_bidders, self.__history.rounds, self.deadline)
+            if self.contain_faults:
+                for k, (i, bid) in enumerate(zip(active, bids)):
+                    worker = self.__strategies[i].strategy
+                    if worker.failed or worker.error:
+                        self.__fault(k, i, 'worker', worker.failed or worker.error)
+                    elif worker.answered and worker.invalid:  # a late answer to an earlier round isn't this round's bid
+                        self.__fault(k, i, 'invalid bid', worker.invalid)
+            return bids
+        if self.contain_faults:
+            return tuple(self.__contained_bid(k, i, value, num_bidders) for k, (i, value) in enumerate(zip(active, self.values)))
+        return tuple(self.__strategies[i].bid(value, num_bidders) for i, value in zip(active, self.values))
+
+    def __contained_bid(self, k, i, value, num_bidders):
+        try:
+            bid = self.__strategies[i].bid(value, num_bidders)
+        except Exception:
+            self.__fault(k, i, 'exception', traceback.format_exc())
+            return float('nan')
+        invalid = self.__strategies[i].invalid_bid()
+        if invalid:
+            self.__fault(k, i, 'invalid bid', invalid)
+        return bid
+
+    def __fault(self, k, i, kind, detail):
+        self.__faulted.append(k)
+        self.failures.append(Failure(self.__round_number, self.__strategies[i].name, kind, detail))
+
+    def __bid_round(self, active):
+        # Values and bids of the round. In a contained run, bots that faulted are disqualified and left out.
+        values = self.__get_values(active)
+        bids = self.__get_bids(active)
+        if self.time_limit is not None or self.memory_limit is not None:
+            bids = self.__enforce_budgets(active, bids)
+        if self.__faulted:
+            keep = np.ones(len(active), dtype=bool)
+            keep[self.__faulted] = False
+            self.__faulted = []
+            self.__disqualify(active[~keep])
+            active = active[keep]
+            values = [value for value, kept in zip(values, keep) if kept]
+            bids = tuple(bid for bid, kept in zip(bids, keep) if kept)
+        return active, values, bids
+
+    def __enforce_budgets(self, active, bids):
+        bids = list(bids)
+        check_memory = self.memory_limit is not None and (self.__round_number == 1 or self.__round_number % self.memory_check_interval == 0)
+        for k, i in enumerate(active):
+            strategy = self.__strategies[i]
+            if k in self.__faulted:
+                continue  # already out
+            # A worker still busy has missed the round's deadline, and with it the time limit
+            waiting = self.workers and strategy.strategy.waiting
+            if self.time_limit is not None and (waiting or strategy.last_call > self.time_limit * 1e9):
+                self.__strikes[i] += 1
+                if self.__strikes[i] >= self.time_strikes:
+                    last = f"still running after the {self.deadline * 1e3:g} ms deadline" if waiting else f"the last took {strategy.last_call / 1e6:.2f} ms"
+                    self.__fault(k, i, 'time limit', f"{self.__strikes[i]} calls over {self.time_limit * 1e3:g} ms, {last}")
+                    continue
+                bids[k] = strategy.bid_value = -2  # thrown out like an out-of-range bid
+            if check_memory:
+                usage = strategy.memory_usage()
+                if usage > self.memory_limit:
+                    self.__fault(k, i, 'memory limit', f"{usage / 2**20:.2f} MB, limit {self.memory_limit / 2**20:.2f} MB")
+        return tuple(bids)
+
+    def __disqualify(self, indices):
+        self.disqualified[indices] = True
+        self.__active = self.__active[~self.disqualified[self.__active]]
+        for i in indices:
+            self.__strategies[i].bid_value = float('-inf')
+            if isinstance(self.__strategies[i].strategy, StrategyWorker):
+                self.__strategies[i].strategy.close()
 
     def find_two_highest(self, nums):
-        first, second = float('-inf'), float('-inf')
-        for num in nums:
-            if num > first:
-                first, second = num, first
-            elif num > second and num != first:
-                second = num
-        return first, second
+        first, second = top_two(np.asarray(nums, dtype=float))
+        return float(first), float(second)
 
     def run_auction(self):
-        # Simulates 1 round of the auction
+        # Simulates 1 round of the auction. Returns None once nobody is left to bid, which ends the run.
+        active = self.__active
+        if not len(active):
+            return self.__finish()
         self.__round_number += 1
-        values = self.__get_values()
-        bids, strategies = zip(*self.__get_bids())
+        if len(active) == 1 and not self.log:
+            return self.__run_alone(active)
+        active, values, bids = self.__bid_round(active)
+        if not len(active):
+            return self.__finish()  # the last bidders were all disqualified
         winning_bid, second_highest = self.find_two_highest(bids)
         
         if self.log:
@@ -65,38 +275,201 @@ class Auction:
             print(f"Bids: {bids}")
             print(f"Top 2 bids are {winning_bid:0.2f}, {second_highest:0.2f}")
         
-        max_value = max(values)
-        
         if winning_bid < 0:
-            print("SOMETHING WENT WRONG. ALL BOTS EITHER MADE ILLEGAL BIDS OR ARE OUT OF CAPITAL.")
-            print("Bids from active bots:", bids)
-            print("Values obtained by active bots:", values)
-            print("Capitals remaining:", [strategy.capital for strategy in self.__strategies])
-            exit(1)
-
-        for strategy in strategies:
-            winning_value = max_value if self.type == 'max' else strategy.value
-            if self.compare(strategy.bid_value, winning_bid):
-                self.__dead_strategies += strategy.update_capital(winning_value, winning_bid, second_highest, winner=True)
-            elif self.compare(strategy.bid_value, second_highest):
-                self.__dead_strategies += strategy.update_capital(winning_value, winning_bid, second_highest, winner=False, second=True)
-            else:
-                self.__dead_strategies += strategy.update_capital(winning_value, winning_bid, second_highest)
+            self.__abort(bids, values)
+
+        capitals = self.capitals[active]
+        bid_array, value_array = np.array(bids, dtype=float), np.array(values)
+        died = settle(capitals, bid_array, value_array, winning_bid, second_highest, self.second_highest_fraction, self.type)
+        if self.log:
+            for i, capital_at_start_of_round, capital, just_died in zip(active, self.capitals[active], capitals, died):
+                self.capitals[i] = capital
+                self.__strategies[i].log_round(capital_at_start_of_round)
+                if just_died: print(f"{self.__strategies[i].name} just ran out of capital!")
+        self.capitals[active] = capitals
+        faulted = self.__notify(active[self.__notified[active]], winning_bid, second_highest)
+        if died.any():
+            for i in active[died]:
+                self.__strategies[i].bid_value = float('-inf')
+            self.__dead_strategies += int(died.sum())
+            self.__active = active[~died]  # a new array, so earlier RoundRecords keep theirs
+        if faulted:
+            self.__disqualify(np.array(faulted))
+
+        self.__history.record(winning_bid, second_highest)
+        return self.__record(RoundRecord(self.__round_number, active, value_array, bid_array, winning_bid, second_highest, self.capitals.copy()))
+
+    def __run_alone(self, active):
+        # Only one bot left: it wins every round at its own bid and nobody comes second, so the round settles
+        # with scalar arithmetic instead of top_two / settle (same result, a fraction of the cost)
+        active, values, bids = self.__bid_round(active)
+        if not len(active):
+            return self.__finish()  # the lone bidder was disqualified
+        winning_bid, second_highest = float(bids[0]), float('-inf')
+        if not winning_bid >= 0:  # negative (illegal) or NaN
+            self.__abort(bids, values)
+
+        i = active[0]
+        capital = self.capitals[i] + (values[0] - winning_bid)  # with type 'max' the highest value is its own
+        died = capital <= 0
+        self.capitals[i] = 0 if died else capital
+        faulted = self.__notify(active[self.__notified[active]], winning_bid, second_highest)
+        if died:
+            self.__strategies[i].bid_value = float('-inf')
+            self.__dead_strategies += 1
+            self.__active = active[:0]
+        if faulted:
+            self.__disqualify(np.array(faulted))
+
+        self.__history.record(winning_bid, second_highest)
+        return self.__record(RoundRecord(self.__round_number, active, np.array(values), np.array(bids, dtype=float), winning_bid, second_highest, self.capitals.copy()))
+
+    def __finish(self):
+        # Every bot is out of capital or disqualified, so the remaining rounds can't change anything: skip them
+        self.__round_number = self.round_count
+        return None
+
+    def __record(self, record):
+        if self.__event_log is not None:
+            self.__event_log.record(record)
+        return record
+
+    def __abort(self, bids, values):
+        if self.contain_faults:
+            detail = f"no valid bid; bids {bids}, values {values}"
+            self.failures.append(Failure(self.__round_number, None, 'no valid bids', detail))
+            raise AuctionAborted(detail)
+        print("SOMETHING WENT WRONG. ALL BOTS EITHER MADE ILLEGAL BIDS OR ARE OUT OF CAPITAL.")
+        print("Bids from active bots:", bids)
+        print("Values obtained by active bots:", values)
+        print("Capitals remaining:", [strategy.capital for strategy in self.__strategies])
+        exit(1)
 
     def compare(self, value1, value2, epsilon=0.01):
         return abs(value1 - value2) < epsilon
 
+    @property
+    def round_number(self):
+        return self.__round_number
+
+    @property
+    def names(self):
+        return [strategy.name for strategy in self.__strategies]
+
+    def iter_rounds(self):
+        # Runs the remaining rounds lazily, yielding a RoundRecord after each one; callers may stop early
+        if self.checkpoint is not None and self.__checkpoint_writer is None:
+            self.__checkpoint_writer = CheckpointWriter(self.checkpoint)
+            self.__last_checkpoint = time.perf_counter()
+        if self.event_log is not None and self.__event_log is None:
+            # The parameters let Replay.py re-run one bot against this log
+            parameters = dict(seed=self.seed, round_count=self.round_count, max_value=self.max_value, second_highest_fraction=self.second_highest_fraction,
+                              type=self.type, info_size=self.info_size, distribution=self.__distribution_name)
+            self.__event_log = EventLogWriter(self.event_log, self.names, self.starting_capital, integer_values=getattr(self.distribution, 'integer', False),
+                                              parameters=parameters, append=self.__event_log_started == self.event_log)
+            self.__event_log_started = self.event_log
+        try:
+            while self.__round_number < self.round_count:
+                start = time.perf_counter()
+                try:
+                    record = self.run_auction()
+                except AuctionAborted:
+                    self.status = 'aborted'
+                    break
+                self.run_time += time.perf_counter() - start
+                if record is None:
+                    break
+                if self.__checkpoint_writer is not None and start - self.__last_checkpoint >= self.checkpoint_interval:
+                    self.save_checkpoint()
+                yield record
+        finally:
+            if self.__checkpoint_writer is not None:
+                self.__checkpoint_writer.wait()
+            if self.__event_log is not None:
+                self.__event_log.close()
+                self.__event_log = None
+            if self.__round_number >= self.round_count or self.status == 'aborted':
+                self.close()
+        if self.status == 'running':
+            self.status = 'completed'
+        self.final_profits = [strategy.capital - self.starting_capital for strategy in self.__strategies]
+
+    def save_checkpoint(self):
+        # Snapshot of the auction, its strategies and the global random states, written in the background
+        if self.__checkpoint_writer is None:
+            self.__checkpoint_writer = CheckpointWriter(self.checkpoint)
+        self.__last_checkpoint = time.perf_counter()
+        self.__checkpoint_writer.write((self, random.getstate(), np.random.get_state()))
+
+    def __getstate__(self):
+        if self.workers:
+            raise ValueError("Auctions with strategy workers can't be checkpointed")
+        state = self.__dict__.copy()
+        # Open files and threads stay with the running auction; resume() opens new ones
+        state['_Auction__event_log'] = None
+        state['_Auction__checkpoint_writer'] = None
+        return state
+
+    @classmethod
+    def resume(cls, checkpoint, event_log=None):
+        '''
+        Auction restored from a checkpoint file, ready to continue with simulate() or iter_rounds().
+        It keeps checkpointing to the same file. An event log, if given, starts afresh with the resumed rounds.
+        Strategy folders are imported again, so resume from the directory the auction was started in.
+        '''
+        auction, random_state, numpy_state = read_checkpoint(checkpoint)
+        random.setstate(random_state)
+        np.random.set_state(numpy_state)
+        auction.checkpoint = checkpoint
+        auction.event_log = event_log
+        auction.__event_log_started = None
+        return auction
+
     def simulate(self):
-        while self.__round_number < self.round_count:
-            self.run_auction()
-        self.print_final_profits()
+        for _ in self.iter_rounds():
+            pass
+        if self.verbose:
+            self.print_final_profits()
+
+    def close(self):
+        # Stops the strategy worker processes and frees the shared history, if any
+        for strategy in self.__strategies:
+            if isinstance(strategy.strategy, StrategyWorker):
+                strategy.strategy.close()
+        self.__history.unlink()
+
+    def results(self):
+        # Structured outcome of the run, e.g. for sweeps that must not stop on one broken bot
+        return {'names': self.names, 'final_profits': self.final_profits, 'rounds': self.__round_number, 'status': self.status,
+                'disqualified': [name for name, disqualified in zip(self.names, self.disqualified) if disqualified],
+                'failures': [failure._asdict() for failure in self.failures]}
+
+    def timings(self):
+        # Per-bot bid latency and share of run time, slowest bot first (see Strategy.timing_report)
+        return timing_report(self.__strategies, self.run_time)
+
+    def print_timings(self):
+        print_timing_report(self.timings())
 
     def print_final_profits(self):
         print("\nFinal Profits:")
         for i, strategy in enumerate(self.__strategies):
             final_profit = strategy.capital - self.starting_capital
             print(f"Bot {i+1} ({strategy.name}): Final Profit = {final_profit:.2f}")
+        print_failures(self.failures)
+
+
+def format_failure(failure):
+    reason = failure.detail.strip().splitlines()[-1] if failure.detail else ''  # last line of a traceback
+    return f"Round {failure.round}: {failure.bot or 'auction'} - {failure.kind}: {reason}"
+
+def print_failures(failures):
+    if failures:
+        print(f"\n{len(failures)} failure(s):")
+    for failure in failures:
+        print(format_failure(failure))
 
 
 # Example usage
 # auction = Auction(strategy_folder='strategy_folder', round_count=1000, starting_capital=100, max_value=100, second_highest_fraction=0.5, type='max', log=True)
+# auction.simulate()  # or iterate auction.iter_rounds() to stream per-round records
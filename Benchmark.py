@@ -0,0 +1,125 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import itertools
+import resource
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from Auction import Auction
+from Strategy import StrategyBase
+
+STRATEGY_FOLDERS = ['Test Strategy 1', 'Test Strategy 2', 'Test Strategy 3']
+
+
+class TrivialBot(StrategyBase):
+    # Near-free bid, so a benchmark with these bots measures the engine itself
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return current_value * (0.5 + 0.4 * self.rng.random())
+
+
+def trivial_bots(count):
+    return [(f"Trivial{i+1}", TrivialBot) for i in range(count)]
+
+
+def peak_rss_mb():
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (2**20 if sys.platform == 'darwin' else 2**10)
+
+
+def run_case(case):
+    # Runs one benchmark case; called in a fresh worker process so peak memory belongs to this case alone
+    strategies = trivial_bots(case['bots']) if case['kind'] == 'synthetic' else case['folder']
+    rss_before = peak_rss_mb()
+    start = time.perf_counter()
+    auction = Auction(strategies, case['rounds'], case['capital'], 100, 0.3, type=case['type'], info_size=case['info_size'], verbose=False, seed=0)
+    setup = time.perf_counter() - start
+    start = time.perf_counter()
+    auction.simulate()
+    seconds = time.perf_counter() - start
+    return dict(case, bots=len(auction.names), setup_seconds=setup, seconds=seconds, rounds_per_sec=case['rounds'] / seconds,
+                bids_per_sec=sum(timing['calls'] for timing in auction.timings()) / seconds,
+                rss_before_mb=rss_before, peak_rss_mb=peak_rss_mb())
+
+
+def benchmark_cases(bots, rounds, info_sizes, types, folders, capital=1e9):
+    '''
+    Grid of cases: synthetic TrivialBot auctions for every bot count, and the bundled strategy folders for realistic cost,
+    each crossed with every round count, info_size and auction type. The large default capital keeps every bot alive.
+    '''
+    cases = [dict(kind='synthetic', bots=count, rounds=round_count, info_size=info_size, type=type, capital=capital)
+             for count, round_count, info_size, type in itertools.product(bots, rounds, info_sizes, types)]
+    cases += [dict(kind='strategies', folder=folder, rounds=round_count, info_size=info_size, type=type, capital=capital)
+              for folder, round_count, info_size, type in itertools.product(folders, rounds, info_sizes, types)]
+    return cases
+
+
+def run_benchmarks(cases, verbose=True):
+    results = []
+    # One process per case (max_tasks_per_child=1) so imports, caches and peak RSS don't leak between cases
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        for result in executor.map(run_case, cases):
+            results.append(result)
+            if verbose:
+                print_result(result)
+    return {'environment': environment(), 'results': results}
+
+
+def environment():
+    return {'python': platform.python_version(), 'numpy': np.__version__, 'platform': platform.platform(),
+            'cpu_count': os.cpu_count(), 'date': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+
+def case_key(result):
+    return (result['kind'], result.get('folder'), result['bots'], result['rounds'], result['info_size'], result['type'])
+
+
+def print_result(result):
+    label = result.get('folder') or f"{result['bots']} trivial bots"
+    print(f"{label}, {result['rounds']} rounds, info_size {result['info_size']}, type {result['type']}: "
+          f"{result['rounds_per_sec']:.0f} rounds/s, {result['bids_per_sec']:.0f} bids/s, peak RSS {result['peak_rss_mb']:.1f} MB")
+
+
+def compare(baseline, current, tolerance=0.1):
+    '''
+    Cases whose throughput dropped or whose peak memory grew by more than `tolerance` (a fraction) against a baseline
+    result file. Returns a list of (case, metric, baseline value, current value).
+    '''
+    previous = {case_key(result): result for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        old = previous.get(case_key(result))
+        if old is None:
+            continue
+        if result['rounds_per_sec'] < old['rounds_per_sec'] * (1 - tolerance):
+            regressions.append((case_key(result), 'rounds_per_sec', old['rounds_per_sec'], result['rounds_per_sec']))
+        if result['peak_rss_mb'] > old['peak_rss_mb'] * (1 + tolerance):
+            regressions.append((case_key(result), 'peak_rss_mb', old['peak_rss_mb'], result['peak_rss_mb']))
+    return regressions
+
+
+if __name__=='__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-bots', type=int, nargs='+', default=[10, 100, 1000, 10000], help='Synthetic bot counts')
+    parser.add_argument('-rounds', type=int, nargs='+', default=[200], help='Round counts')
+    parser.add_argument('-info', type=int, nargs='+', default=[100], help='info_size values')
+    parser.add_argument('-types', nargs='+', default=['self', 'max'], choices=['self', 'max'], help='Auction types')
+    parser.add_argument('-folders', nargs='*', default=STRATEGY_FOLDERS, help='Strategy folders for realistic cases')
+    parser.add_argument('-output', default='benchmark.json', help='JSON file to write results to')
+    parser.add_argument('-compare', default=None, help='Baseline JSON to check for regressions')
+    parser.add_argument('-tolerance', type=float, default=0.1, help='Allowed slowdown / memory growth before a case counts as a regression')
+    args = parser.parse_args()
+    results = run_benchmarks(benchmark_cases(args.bots, args.rounds, args.info, args.types, args.folders))
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {args.output}")
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(json.load(file), results, args.tolerance)
+        for key, metric, old, new in regressions:
+            print(f"REGRESSION {key}: {metric} {old:.1f} -> {new:.1f}")
+        if regressions:
+            exit(1)
@@ -0,0 +1,65 @@
+import os
+import time
+import zlib
+import pickle
+import argparse
+import threading
+
+MAGIC = b'AUCTCKP1'
+
+
+def write_checkpoint(path, state):
+    '''
+    Compresses pickled `state` and writes it to `path` atomically: the file is written and synced under a temporary
+    name and then renamed over the old one, so a crash mid-write leaves the previous checkpoint intact.
+    '''
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as file:
+        file.write(MAGIC + zlib.compress(state, 1))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+def read_checkpoint(path):
+    with open(path, 'rb') as file:
+        data = file.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not an auction checkpoint")
+    return pickle.loads(zlib.decompress(data[len(MAGIC):]))
+
+
+class CheckpointWriter:
+    '''
+    Takes snapshots on the caller's thread (pickling is the only part that has to pause the run) and compresses and
+    writes them on a background thread. A new snapshot waits for the previous write to finish.
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self.__thread = None
+
+    def write(self, snapshot):
+        state = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        self.wait()
+        self.__thread = threading.Thread(target=write_checkpoint, args=(self.path, state), daemon=True)
+        self.__thread.start()
+
+    def wait(self):
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+
+if __name__=='__main__':
+    from Auction import Auction
+    parser = argparse.ArgumentParser()
+    parser.add_argument('path', help='Checkpoint written by Auction(checkpoint=...)')
+    parser.add_argument('-event_log', default=None, help='Write a binary event log of the resumed rounds to this file')
+    args = parser.parse_args()
+    start = time.time()
+    auction = Auction.resume(args.path, event_log=args.event_log)
+    print(f"Resuming at round {auction.round_number + 1} of {auction.round_count}")
+    auction.simulate()
+    end = time.time()
+    print(f"Execution time: {end-start:0.3f}")
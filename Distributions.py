@@ -0,0 +1,125 @@
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class Distribution(ABC):
+    '''
+    Distribution that bot values are drawn from. Subclasses sample a whole array per call.
+    '''
+
+    def __init__(self, max_value):
+        self.max_value = max_value
+
+    @abstractmethod
+    def sample(self, rng, size):
+        """
+        Draw values.
+        :param rng: numpy Generator to draw from.
+        :param size: Output shape; the last axis is the bots of one round.
+        :return: Array of values of shape `size`.
+        """
+        pass
+
+    def clip(self, values):
+        return np.clip(values, 0, self.max_value)
+
+
+class Uniform(Distribution):
+    # Integers in [low, max_value] by default, which is what Auction has always drawn
+    def __init__(self, max_value, low=0, integer=True):
+        super().__init__(max_value)
+        self.low = low
+        self.integer = integer
+
+    def sample(self, rng, size):
+        if self.integer:
+            return rng.integers(self.low, self.max_value, size=size, endpoint=True)
+        return rng.uniform(self.low, self.max_value, size=size)
+
+
+class Normal(Distribution):
+    def __init__(self, max_value, mean=None, std=None):
+        super().__init__(max_value)
+        self.mean = max_value / 2 if mean is None else mean
+        self.std = max_value / 6 if std is None else std
+
+    def sample(self, rng, size):
+        return self.clip(rng.normal(self.mean, self.std, size=size))
+
+
+class LogNormal(Distribution):
+    # Right-skewed values: mostly small, occasionally close to max_value
+    def __init__(self, max_value, median=None, sigma=0.5):
+        super().__init__(max_value)
+        self.median = max_value / 4 if median is None else median
+        self.sigma = sigma
+
+    def sample(self, rng, size):
+        return self.clip(rng.lognormal(np.log(self.median), self.sigma, size=size))
+
+
+class Beta(Distribution):
+    def __init__(self, max_value, a=2, b=2):
+        super().__init__(max_value)
+        self.a = a
+        self.b = b
+
+    def sample(self, rng, size):
+        return self.max_value * rng.beta(self.a, self.b, size=size)
+
+
+class Empirical(Distribution):
+    # Resamples observed values, given as an array or a path to a text / .csv file of numbers
+    def __init__(self, max_value, data):
+        super().__init__(max_value)
+        if isinstance(data, str):
+            data = np.loadtxt(data, delimiter=',' if data.endswith('.csv') else None)
+        self.data = np.asarray(data, dtype=float).ravel()
+
+    def sample(self, rng, size):
+        return rng.choice(self.data, size=size)
+
+
+class CommonValue(Distribution):
+    '''
+    Correlated values: every bot in a round sees one shared common value plus its own private noise.
+    '''
+
+    def __init__(self, max_value, mean=None, common_std=None, private_std=None):
+        super().__init__(max_value)
+        self.mean = max_value / 2 if mean is None else mean
+        self.common_std = max_value / 6 if common_std is None else common_std
+        self.private_std = max_value / 20 if private_std is None else private_std
+
+    def sample(self, rng, size):
+        size = (size,) if np.isscalar(size) else tuple(size)
+        common = rng.normal(self.mean, self.common_std, size=size[:-1] + (1,))
+        return self.clip(common + rng.normal(0, self.private_std, size=size))
+
+
+DISTRIBUTIONS = {
+    'uniform': Uniform,
+    'normal': Normal,
+    'lognormal': LogNormal,
+    'beta': Beta,
+    'empirical': Empirical,
+    'common': CommonValue,
+}
+
+
+def get_distribution(distribution, max_value, **kwargs):
+    # Accepts a Distribution instance or the name of one (extra keyword arguments go to its constructor).
+    # The empirical distribution is named with its data file, as 'empirical:<path>'.
+    if isinstance(distribution, Distribution):
+        return distribution
+    name, _, path = distribution.partition(':')
+    if name not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution '{distribution}'. Choose from {', '.join(DISTRIBUTIONS)}")
+    if name == 'empirical':
+        if path:
+            kwargs['data'] = path
+        elif 'data' not in kwargs:
+            raise ValueError("The empirical distribution needs data: name it 'empirical:<path to a text / .csv file>' or pass an Empirical object")
+    elif path:
+        raise ValueError(f"The {name} distribution takes no data file")
+    return DISTRIBUTIONS[name](max_value, **kwargs)
@@ -0,0 +1,141 @@
+import json
+import queue
+import struct
+import threading
+import argparse
+import numpy as np
+
+MAGIC = b'AUCTLOG1'
+COLUMNS = ('values', 'bids', 'capitals')  # per-bot columns, NaN where a bot did not take part in the round
+
+
+class EventLogWriter:
+    '''
+    Appends settled rounds to a columnar binary file.
+    Rounds are copied into preallocated numpy blocks on the hot path; full blocks are written by a background thread.
+
+    File layout: MAGIC, a length-prefixed JSON header, then blocks of
+    uint32 row count, int64 round[rows], float64 winning_bid[rows], float64 second_highest[rows],
+    and float64 values / bids / capitals[rows, bots], all little-endian.
+    With append=True the rounds are added to the end of an existing log of the same run and no header is written.
+    '''
+
+    def __init__(self, path, names, starting_capital, integer_values=False, parameters=None, block_rounds=4096, append=False):
+        self.path = path
+        self.bots = len(names)
+        self.block_rounds = block_rounds
+        self.__file = open(path, 'ab' if append else 'wb')
+        if not append:
+            header = json.dumps({'names': names, 'starting_capital': starting_capital, 'integer_values': integer_values,
+                                 'parameters': parameters or {}}).encode()
+            self.__file.write(MAGIC + struct.pack('<I', len(header)) + header)
+        self.__queue = queue.Queue(maxsize=8)
+        self.__writer = threading.Thread(target=self.__write_blocks, daemon=True)
+        self.__writer.start()
+        self.__new_block()
+
+    def __new_block(self):
+        self.__rows = 0
+        self.__rounds = np.empty(self.block_rounds, dtype='<i8')
+        self.__top = np.empty((2, self.block_rounds), dtype='<f8')
+        self.__columns = np.full((len(COLUMNS), self.block_rounds, self.bots), np.nan, dtype='<f8')
+
+    def record(self, record):
+        # record is an Auction RoundRecord
+        row = self.__rows
+        self.__rounds[row] = record.round
+        self.__top[0, row] = record.winning_bid
+        self.__top[1, row] = record.second_highest
+        self.__columns[0, row, record.active] = record.values
+        self.__columns[1, row, record.active] = record.bids
+        self.__columns[2, row] = record.capitals
+        self.__rows += 1
+        if self.__rows == self.block_rounds:
+            self.flush()
+
+    def flush(self):
+        if self.__rows:
+            self.__queue.put((self.__rows, self.__rounds, self.__top, self.__columns))
+            self.__new_block()
+
+    def __write_blocks(self):
+        while True:
+            block = self.__queue.get()
+            if block is None:
+                return
+            rows, rounds, top, columns = block
+            self.__file.write(struct.pack('<I', rows))
+            self.__file.write(rounds[:rows].tobytes())
+            self.__file.write(top[:, :rows].tobytes())
+            self.__file.write(columns[:, :rows].tobytes())
+
+    def close(self):
+        self.flush()
+        self.__queue.put(None)
+        self.__writer.join()
+        self.__file.close()
+
+
+def read_event_log(path):
+    '''
+    Reads a log written by EventLogWriter.
+    Returns the header dict and a dict of columns: round, winning_bid, second_highest (rounds,) and values, bids, capitals (rounds, bots).
+    '''
+    with open(path, 'rb') as file:
+        data = file.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not an auction event log")
+    offset = len(MAGIC)
+    header_size, = struct.unpack_from('<I', data, offset)
+    offset += 4
+    header = json.loads(data[offset:offset + header_size])
+    offset += header_size
+    bots = len(header['names'])
+    blocks = []
+    while offset < len(data):
+        rows, = struct.unpack_from('<I', data, offset)
+        offset += 4
+        rounds = np.frombuffer(data, dtype='<i8', count=rows, offset=offset)
+        offset += 8 * rows
+        top = np.frombuffer(data, dtype='<f8', count=2 * rows, offset=offset).reshape(2, rows)
+        offset += 16 * rows
+        columns = np.frombuffer(data, dtype='<f8', count=len(COLUMNS) * rows * bots, offset=offset).reshape(len(COLUMNS), rows, bots)
+        offset += 8 * len(COLUMNS) * rows * bots
+        blocks.append((rounds, top, columns))
+    columns = {
+        'round': np.concatenate([rounds for rounds, _, _ in blocks]) if blocks else np.empty(0, dtype=np.int64),
+        'winning_bid': np.concatenate([top[0] for _, top, _ in blocks]) if blocks else np.empty(0),
+        'second_highest': np.concatenate([top[1] for _, top, _ in blocks]) if blocks else np.empty(0),
+    }
+    for i, name in enumerate(COLUMNS):
+        columns[name] = np.concatenate([block[i] for _, _, block in blocks]) if blocks else np.empty((0, bots))
+    return header, columns
+
+
+def print_event_log(path, first_round=1, last_round=None):
+    # Prints rounds in the same format as Auction(log=True); integer bids such as the -2 for an illegal bid come back as floats
+    header, columns = read_event_log(path)
+    names = header['names']
+    previous = np.full(len(names), float(header['starting_capital']))
+    for row, round_number in enumerate(columns['round']):
+        capitals = columns['capitals'][row]
+        if first_round <= round_number and (last_round is None or round_number <= last_round):
+            active = np.flatnonzero(~np.isnan(columns['values'][row]))
+            values, bids = columns['values'][row, active], columns['bids'][row, active]
+            print(f"Round {round_number}:")
+            print(f"Values: {(values.astype(int) if header.get('integer_values') else values).tolist()}")
+            print(f"Bids: {tuple(bids.tolist())}")
+            print(f"Top 2 bids are {columns['winning_bid'][row]:0.2f}, {columns['second_highest'][row]:0.2f}")
+            for i, value, bid in zip(active, values, bids):
+                print(f"{names[i]}: bid - {bid:.2f}, initial_capital - {previous[i]:.2f}, value - {value:.2f}, capital left - {capitals[i]:.2f} ")
+                if previous[i] > 0 and capitals[i] <= 0: print(f"{names[i]} just ran out of capital!")
+        previous = capitals
+
+
+if __name__=='__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('path', help='Event log written by Auction(event_log=...)')
+    parser.add_argument('-first', type=int, default=1, help='First round to print')
+    parser.add_argument('-last', type=int, default=None, help='Last round to print')
+    args = parser.parse_args()
+    print_event_log(args.path, args.first, args.last)
@@ -0,0 +1,144 @@
+import random
+import time
+import argparse
+import numpy as np
+from Auction import load_strategy_classes
+from Distributions import get_distribution
+from Settlement import top_two, settle
+from Strategy import StrategyBase, StrategyHelper, RoundHistory, timing_report, print_timing_report
+from Tournament import summarize_profits, print_summary
+
+
+class MultiAuction:
+    '''
+    Runs `auction_count` independent auctions of one strategy folder in lockstep.
+    Capitals, values and bids are (auctions x bots) arrays and every round is settled for all auctions in one step.
+    Strategies implementing make_bids_batch bid for every auction in one call with a single instance; the rest
+    get one instance per auction and are called once per auction.
+    '''
+
+    def __init__(self, strategy_folder, auction_count, round_count, starting_capital, max_value, second_highest_fraction, type='self', info_size=100, verbose=True, seed=None, distribution='uniform'):
+        self.strategy_folder = strategy_folder
+        self.auction_count = auction_count
+        self.round_count = round_count
+        self.round_number = 0
+        self.starting_capital = starting_capital
+        self.max_value = max_value
+        self.second_highest_fraction = second_highest_fraction
+        self.type = type
+        self.info_size = info_size
+        self.verbose = verbose
+        self.distribution = get_distribution(distribution, max_value)
+        self.history = RoundHistory(info_size, auction_count)  # one winning / second-highest history per auction
+        # Streams are spawned in the same order as Auction, so a single auction draws the same numbers as Auction(seed=seed)
+        self.__seed_sequence = np.random.SeedSequence(seed)
+        self.__rng = np.random.default_rng(self.__seed_sequence.spawn(1)[0])
+        if seed is not None:
+            random.seed(int(self.__seed_sequence.generate_state(1)[0]))
+            np.random.seed(self.__seed_sequence.generate_state(1)[0])
+        self.__load_strategies()
+        self.capitals = np.full((auction_count, len(self.strategies)), float(starting_capital))
+        for i, helpers in enumerate(self.strategies):
+            for j, helper in enumerate(helpers):
+                helper.bind_capital(self.capitals, (j, i))
+        self.dead_strategies = np.zeros(auction_count, dtype=int)
+        self.final_profits = np.zeros_like(self.capitals)
+        self.run_time = 0.0
+
+    def __load_strategies(self):
+        # self.strategies[i] is a list of helpers for bot i: one shared batch helper, or one per auction
+        self.names = []
+        self.strategies = []
+        for module_name, strategy_class in load_strategy_classes(self.strategy_folder):
+            self.names.append(module_name)
+            batch = strategy_class.make_bids_batch is not StrategyBase.make_bids_batch
+            instances = [strategy_class() for _ in range(1 if batch else self.auction_count)]
+            self.strategies.append([StrategyHelper(module_name, instance, self.starting_capital, self.max_value, second_highest_fraction=self.second_highest_fraction,
+                                                   log=False, info_size=self.info_size, history=self.history, rng=np.random.default_rng(self.__seed_sequence.spawn(1)[0]), history_row=j)
+                                    for j, instance in enumerate(instances)])
+
+    def __get_bids(self, alive, values):
+        bids = np.full(values.shape, float('-inf'))
+        num_bidders = len(self.strategies) - self.dead_strategies
+        for i, helpers in enumerate(self.strategies):
+            rows = np.flatnonzero(alive[:, i])
+            if not len(rows):
+                continue
+            if helpers[0].has_batch:
+                # Every auction, so row j is always auction j for the bot's per-row state; bids where it is out are dropped
+                winners = self.history.winners.window(self.info_size)
+                second_highest = self.history.second_highest.window(self.info_size)
+                batch_bids = helpers[0].bid_batch(values[:, i], winners, second_highest, self.capitals[:, i], num_bidders)
+                bids[rows, i] = batch_bids[rows]
+            else:
+                for j in rows:
+                    bids[j, i] = helpers[j].bid(values[j, i].item(), num_bidders[j].item())
+        return bids
+
+    def run_auction(self):
+        # Simulates 1 round of every auction. Auctions whose field has all gone broke are over: they get no bids
+        # and their capitals stay as they are (values are still drawn for them, so the others' stay the same).
+        self.round_number += 1
+        alive = self.capitals > 0
+        running = alive.any(axis=1)
+        values = self.distribution.sample(self.__rng, self.capitals.shape)
+        bids = self.__get_bids(alive, values)
+        winning_bid, second_highest = top_two(bids)
+
+        if np.any(running & (winning_bid < 0)):
+            j = int(np.argmax(running & (winning_bid < 0)))
+            print(f"SOMETHING WENT WRONG IN AUCTION {j}. ALL BOTS EITHER MADE ILLEGAL BIDS OR ARE OUT OF CAPITAL.")
+            print("Bids from active bots:", bids[j, alive[j]].tolist())
+            print("Values obtained by active bots:", values[j, alive[j]].tolist())
+            print("Capitals remaining:", self.capitals[j].tolist())
+            exit(1)
+
+        # Bots that are out of capital must not set the 'max' winning value; rows that are over settle nothing
+        died = settle(self.capitals, bids, np.where(alive, values, float('-inf')), winning_bid, second_highest, self.second_highest_fraction, self.type)
+        self.dead_strategies += died.sum(axis=1)
+        for i, helpers in enumerate(self.strategies):
+            if helpers[0].has_round_callback and not helpers[0].has_batch:
+                for j in np.flatnonzero(alive[:, i]):
+                    helpers[j].notify(winning_bid[j].item(), second_highest[j].item())
+        self.history.record(winning_bid, second_highest)
+
+    def simulate(self):
+        start = time.perf_counter()
+        while self.round_number < self.round_count:
+            if not (self.capitals > 0).any():
+                self.round_number = self.round_count  # every auction is over; the remaining rounds can't change anything
+                break
+            self.run_auction()
+        self.run_time += time.perf_counter() - start
+        self.final_profits = self.capitals - self.starting_capital
+        if self.verbose:
+            self.print_results()
+
+    def summary(self):
+        return summarize_profits(self.names, self.final_profits)
+
+    def print_results(self):
+        print_summary(self.summary(), self.auction_count)
+
+    def timings(self):
+        return timing_report([helper for helpers in self.strategies for helper in helpers], self.run_time)
+
+
+if __name__=='__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('folder', help='Strategy folder to evaluate')
+    parser.add_argument('-auctions', type=int, default=100, help='Number of auctions run in lockstep')
+    parser.add_argument('-rounds', type=int, default=1000, help='Rounds per auction')
+    parser.add_argument('-capital', type=float, default=500, help='Starting capital')
+    parser.add_argument('-fraction', type=float, default=0, help='Second highest fraction')
+    parser.add_argument('-type', default='self', choices=['self', 'max'], help='Auction type')
+    parser.add_argument('-seed', type=int, default=None, help='Seed for a reproducible run')
+    parser.add_argument('-timings', action='store_true', help='Print per-bot bid latency')
+    args = parser.parse_args()
+    start = time.time()
+    auction = MultiAuction(args.folder, args.auctions, args.rounds, args.capital, 100, args.fraction, type=args.type, seed=args.seed)
+    auction.simulate()
+    if args.timings:
+        print_timing_report(auction.timings())
+    end = time.time()
+    print(f"Execution time: {end-start:0.3f}")
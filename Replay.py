@@ -0,0 +1,110 @@
+import time
+import argparse
+import numpy as np
+from Auction import load_strategy_class
+from Distributions import get_distribution
+from EventLog import read_event_log
+from Settlement import top_two, settle
+from Strategy import StrategyHelper, RoundHistory
+
+
+class Replay:
+    '''
+    Re-runs one bot against the opponents' bids recorded in an event log (Auction(event_log=...)).
+    Only the replayed bot's make_bid runs each round; the opponents' bids and every value come from the log and
+    settlement is recomputed for everyone. Opponents that run out of capital in the replay stop bidding, and
+    opponents that were already out on the log sit out. Rounds in which the replayed bot outlives its original
+    draw a fresh value from the log's distribution.
+
+    With a seeded log and an unchanged bot the replay reproduces the original run exactly, as long as the bot
+    draws its randomness from self.rng rather than the global random state.
+    '''
+
+    def __init__(self, event_log, name, strategy, verbose=True):
+        self.header, self.tape = read_event_log(event_log)
+        self.parameters = self.header['parameters']
+        self.names = self.header['names']
+        if name not in self.names:
+            raise ValueError(f"{name} is not in {event_log}. Bots in the log: {', '.join(self.names)}")
+        self.name = name
+        self.index = self.names.index(name)
+        self.verbose = verbose
+        self.starting_capital = self.header['starting_capital']
+        self.round_count = len(self.tape['round'])
+        self.max_value = self.parameters['max_value']
+        self.second_highest_fraction = self.parameters['second_highest_fraction']
+        self.type = self.parameters['type']
+        self.info_size = self.parameters['info_size']
+        self.__round_number = 0
+        # Same spawn order as Auction: the value stream first, then one stream per bot
+        seed_sequence = np.random.SeedSequence(self.parameters['seed'])
+        streams = seed_sequence.spawn(len(self.names) + 1)
+        self.__rng = np.random.default_rng(seed_sequence.spawn(1)[0])  # values for rounds the log has none for
+        self.distribution = get_distribution(self.parameters['distribution'] or 'uniform', self.max_value)
+        self.__history = RoundHistory(self.info_size, max_value=self.max_value)
+        if isinstance(strategy, type):
+            strategy = strategy()
+        self.strategy = StrategyHelper(name, strategy, self.starting_capital, self.max_value, second_highest_fraction=self.second_highest_fraction,
+                                       log=False, info_size=self.info_size, history=self.__history, rng=np.random.default_rng(streams[self.index + 1]))
+        self.capitals = np.full(len(self.names), float(self.starting_capital))
+        self.strategy.bind_capital(self.capitals, self.index)
+        self.final_profits = [0 for _ in self.names]
+
+    def run_auction(self):
+        # Replays 1 round of the log
+        row = self.__round_number
+        self.__round_number += 1
+        values, bids = self.tape['values'][row].copy(), self.tape['bids'][row]
+        opponents = ~np.isnan(bids) & (self.capitals > 0)
+        opponents[self.index] = False
+        bids = np.where(opponents, np.minimum(bids, self.capitals), float('-inf'))  # a poorer opponent can't bid what it did on the log
+        values[~opponents] = float('-inf')
+        if self.capitals[self.index] > 0:
+            value = self.tape['values'][row, self.index]
+            if np.isnan(value):
+                value = self.distribution.sample(self.__rng, 1)[0]
+            value = value.item()
+            if self.header.get('integer_values'):
+                value = int(value)
+            values[self.index] = value
+            bids[self.index] = self.strategy.bid(value, int(opponents.sum()) + 1)
+
+        winning_bid, second_highest = top_two(bids)
+        winning_bid, second_highest = float(winning_bid), float(second_highest)
+        if winning_bid < 0:
+            print(f"SOMETHING WENT WRONG IN ROUND {self.__round_number}. ALL BOTS EITHER MADE ILLEGAL BIDS OR ARE OUT OF CAPITAL.")
+            print("Capitals remaining:", self.capitals.tolist())
+            exit(1)
+
+        participated = self.capitals[self.index] > 0
+        died = settle(self.capitals, bids, values, winning_bid, second_highest, self.second_highest_fraction, self.type)
+        if participated:
+            if self.strategy.has_round_callback:
+                self.strategy.notify(winning_bid, second_highest)
+            if died[self.index]:
+                self.strategy.bid_value = float('-inf')
+        self.__history.record(winning_bid, second_highest)
+
+    def simulate(self):
+        while self.__round_number < self.round_count:
+            self.run_auction()
+        self.final_profits = (self.capitals - self.starting_capital).tolist()
+        if self.verbose:
+            self.print_final_profits()
+
+    def print_final_profits(self):
+        print(f"\nFinal Profits (replaying {self.name}):")
+        for i, name in enumerate(self.names):
+            print(f"Bot {i+1} ({name}): Final Profit = {self.final_profits[i]:.2f}")
+
+
+if __name__=='__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('path', help='Event log written by Auction(event_log=...)')
+    parser.add_argument('folder', help='Strategy folder of the bot to replay')
+    parser.add_argument('bot', help='Bot (module name) to replay, e.g. Bot10')
+    args = parser.parse_args()
+    start = time.time()
+    Replay(args.path, args.bot, load_strategy_class(args.folder, args.bot)[0]).simulate()
+    end = time.time()
+    print(f"Execution time: {end-start:0.3f}")
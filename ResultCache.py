@@ -0,0 +1,171 @@
+import os
+import json
+import inspect
+import hashlib
+import argparse
+import functools
+from Auction import Auction
+
+# Engine modules whose code decides the outcome of a seeded run; editing one of them invalidates every entry
+ENGINE_MODULES = ('Auction.py', 'Strategy.py', 'Settlement.py', 'Distributions.py')
+# Auction arguments that go into the key. Runs using anything else (time or memory budgets, a Distribution
+# instance, ...) are not cached, since their results aren't a function of these alone.
+KEY_ARGUMENTS = ('round_count', 'starting_capital', 'max_value', 'second_highest_fraction', 'type', 'info_size', 'distribution', 'contain_faults')
+
+
+class ResultCache:
+    '''
+    On-disk store of Auction results, content-addressed by a hash of every strategy module's source, the engine's
+    source, the auction parameters and the seed. Entries are small JSON files; once the store grows past
+    `max_bytes` the least recently used ones are deleted. Safe to share between processes: writes are atomic and
+    an entry lost to another process's eviction is simply recomputed.
+    '''
+
+    def __init__(self, directory='.auction_cache', max_bytes=256 * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+        self.__size = None  # bytes on disk, counted on the first put
+        self.__digests = {}  # path -> (mtime_ns, size, sha256), so unchanged files aren't hashed again
+        os.makedirs(directory, exist_ok=True)
+
+    def __digest(self, path):
+        stat = os.stat(path)
+        cached = self.__digests.get(path)
+        if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            with open(path, 'rb') as file:
+                cached = (stat.st_mtime_ns, stat.st_size, hashlib.sha256(file.read()).hexdigest())
+            self.__digests[path] = cached
+        return cached[2]
+
+    def __sources(self, strategy_folder):
+        # name -> source digest for every strategy, or None when a strategy's source can't be found
+        if isinstance(strategy_folder, str):
+            return {file: self.__digest(os.path.join(strategy_folder, file)) for file in sorted(os.listdir(strategy_folder)) if file.endswith('.py')}
+        sources = {}
+        for name, strategy_class in strategy_folder:
+            try:
+                sources[name] = self.__digest(inspect.getsourcefile(strategy_class))
+            except (TypeError, OSError):
+                return None
+        return sources
+
+    def key(self, strategy_folder, seed, auction_args):
+        # Hex digest identifying a run, or None if the run can't be cached
+        if seed is None or not isinstance(auction_args.get('distribution', 'uniform'), str) or set(auction_args) - set(KEY_ARGUMENTS):
+            return None
+        sources = self.__sources(strategy_folder)
+        if sources is None:
+            return None
+        _, _, data = auction_args.get('distribution', 'uniform').partition(':')
+        if data:
+            # 'empirical:<path>' draws from a data file, which can change under the same name
+            try:
+                data = self.__digest(data)
+            except OSError:
+                return None
+        engine = os.path.dirname(os.path.abspath(__file__))
+        content = {'strategies': sources, 'engine': {module: self.__digest(os.path.join(engine, module)) for module in ENGINE_MODULES},
+                   'parameters': {name: auction_args.get(name) for name in KEY_ARGUMENTS}, 'data': data or None, 'seed': seed}
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+    def __path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key):
+        path = self.__path(key)
+        try:
+            with open(path) as file:
+                results = json.load(file)
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return results
+
+    def put(self, key, results):
+        path = self.__path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as file:
+            json.dump(results, file)
+        os.replace(temporary, path)
+        if self.__size is None:
+            self.__size = sum(size for _, size, _ in self.__entries())
+        else:
+            self.__size += os.path.getsize(path)
+        if self.__size > self.max_bytes:
+            self.evict()
+
+    def __entries(self):
+        # (last used, size, path) of every entry
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for file in files:
+                if file.endswith('.json'):
+                    path = os.path.join(root, file)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue  # evicted by another process meanwhile
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self, target=None):
+        # Deletes least recently used entries until the store is below `target` bytes (90% of max_bytes by default)
+        target = 0.9 * self.max_bytes if target is None else target
+        entries = sorted(self.__entries())
+        size = sum(size for _, size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= entry_size
+        self.__size = size
+
+    def clear(self):
+        self.evict(0)
+
+    def stats(self):
+        # (entries, bytes) currently on disk
+        entries = self.__entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+
+@functools.lru_cache(maxsize=None)
+def open_cache(directory='.auction_cache', max_bytes=256 * 2**20):
+    # One ResultCache per directory and process, so pool workers keep their file digests between runs
+    return ResultCache(directory, max_bytes)
+
+
+def run_cached(strategy_folder, seed, auction_args, cache=None):
+    '''
+    Auction.results() of a seeded run, taken from `cache` (a ResultCache) when the same run was done before.
+    '''
+    key = cache.key(strategy_folder, seed, auction_args) if cache is not None else None
+    if key is not None:
+        results = cache.get(key)
+        if results is not None:
+            return results
+    auction = Auction(strategy_folder, verbose=False, seed=seed, **auction_args)
+    auction.simulate()
+    results = auction.results()
+    if key is not None:
+        cache.put(key, results)
+    return results
+
+
+if __name__=='__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-dir', default='.auction_cache', help='Cache directory')
+    parser.add_argument('-clear', action='store_true', help='Delete every entry')
+    args = parser.parse_args()
+    cache = ResultCache(args.dir)
+    if args.clear:
+        cache.clear()
+    entries, size = cache.stats()
+    print(f"{entries} entries, {size / 2**20:.2f} MB in {args.dir}")
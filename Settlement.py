@@ -0,0 +1,36 @@
+import numpy as np
+
+
+def top_two(bids):
+    '''
+    Highest bid and the highest bid strictly below it, taken along the last axis.
+    Matches Auction.find_two_highest: NaN bids are ignored and -inf is returned where no such bid exists.
+    '''
+    bids = np.where(np.isnan(bids), -np.inf, bids)
+    first = bids.max(axis=-1, initial=-np.inf)
+    second = np.where(bids < np.expand_dims(first, -1), bids, -np.inf).max(axis=-1, initial=-np.inf)
+    return first, second
+
+
+def settle(capitals, bids, values, winning_bid, second_highest, second_highest_fraction, type='self', epsilon=0.01):
+    '''
+    Settles one round for every bidder along the last axis, updating `capitals` in place.
+    Bidders within epsilon of the winning bid gain their winning value minus the winning bid. Bidders within
+    epsilon of the second-highest bid lose second_highest_fraction of that surplus, capped at their capital.
+    With type 'max' the winning value is the highest value drawn in the round, otherwise the bidder's own.
+    Non-participants (in 2-D use) should carry -inf bids and values so they are never paid or charged.
+    Returns a boolean mask of bidders that ran out of capital this round; their capital is set to 0.
+    '''
+    winning_bid = np.expand_dims(winning_bid, -1)
+    second_highest = np.expand_dims(second_highest, -1)
+    winning_value = values.max(axis=-1, keepdims=True) if type == 'max' else values
+    with np.errstate(invalid='ignore'):
+        surplus = winning_value - winning_bid
+        winner = np.abs(bids - winning_bid) < epsilon
+        second = ~winner & (np.abs(bids - second_highest) < epsilon)
+        penalty = np.minimum(capitals, second_highest_fraction * np.maximum(0, surplus))
+    np.add(capitals, surplus, out=capitals, where=winner)
+    np.subtract(capitals, penalty, out=capitals, where=second)
+    died = (winner | second) & (capitals <= 0)
+    capitals[died] = 0
+    return died
@@ -1,10 +1,22 @@
 from abc import ABC, abstractmethod
+import sys
 import time
+import numbers
 import psutil
 import multiprocessing
+from multiprocessing import shared_memory
+from collections import deque, namedtuple
+import numpy as np
+
+# What a strategy learns about its own result at the end of a round (see StrategyBase.on_round_result)
+RoundOutcome = namedtuple('RoundOutcome', ['bid', 'value', 'capital', 'won', 'second'])
 
 class StrategyBase(ABC):
 
+    # Random generator strategies should draw from instead of np.random / scipy's global state.
+    # Auction replaces it with an independent per-strategy stream derived from its seed.
+    rng = np.random.default_rng()
+
     @abstractmethod
     def make_bid(self, current_value, previous_winners,previous_second_highest_bids,capital,num_bidders):
         """
@@ -15,24 +27,475 @@ class StrategyBase(ABC):
         """
         pass
 
+    def make_bids_batch(self, current_values, previous_winners, previous_second_highest_bids, capitals, num_bidders):
+        """
+        Optional vectorized make_bid for M independent auctions played in lockstep (e.g. one per seed).
+        Override it to let Auction call it instead of make_bid. Any per-auction state must be kept per row:
+        row j is always auction j, and every auction is passed each round, including those this bot is out of
+        (capital 0), whose bids are ignored.
+        :param current_values: Array (M,) of this bot's value in each auction.
+        :param previous_winners: Array (M, k) of winning bids from the last k rounds of each auction.
+        :param previous_second_highest_bids: Array (M, k) of second-highest bids from the same rounds.
+        :param capitals: Array (M,) of capital left in each auction.
+        :param num_bidders: Array (M,) of active bidders in each auction.
+        :return: Array (M,) of bids.
+        """
+        raise NotImplementedError
+
+    def on_round_result(self, winning_bid, second_bid, my_outcome):
+        """
+        Optional callback run after every round this strategy bid in, with just that round's results.
+        Stateful strategies should build their own history here instead of re-reading previous_winners each round.
+        :param winning_bid: Winning bid of the round.
+        :param second_bid: Second-highest bid of the round.
+        :param my_outcome: RoundOutcome with this strategy's bid, value, capital after settlement and whether it won or came second.
+        """
+        pass
+
+class RollingStats:
+    '''
+    Mean, variance, min, max and a quantile sketch over a RingBuffer's window, each updated in O(1) per append.
+    Non-finite entries (e.g. a -inf second-highest bid) are counted apart so results follow numpy's conventions.
+    The quantile sketch is a fixed histogram over [0, max_value]; values outside it fall in two end bins.
+    '''
+
+    def __init__(self,capacity,max_value=100,bins=256):
+        self.capacity = capacity
+        self.max_value = max_value
+        self.bins = bins
+        self.count = 0  # finite entries in the window
+        self.__mean = 0.0
+        self.__m2 = 0.0  # sum of squared deviations from the mean (Welford)
+        self.__neg_inf = self.__pos_inf = self.__nan = 0
+        self.__pushed = 0
+        self.__minima = deque()  # (position, value) with increasing values
+        self.__maxima = deque()  # (position, value) with decreasing values
+        self.__histogram = np.zeros(bins+2,dtype=np.int64)  # [below 0, bins over [0, max_value], above max_value]
+
+    def __bin(self,value):
+        if value < 0: return 0
+        if value > self.max_value: return self.bins + 1
+        return 1 + min(int(value / self.max_value * self.bins),self.bins - 1)
+
+    def push(self,value,evicted=None):
+        # Add `value`; `evicted` is the entry that just left the window, if any
+        value = float(value)
+        if evicted is not None:
+            self.__remove(float(evicted))
+        if value != value: self.__nan += 1
+        elif value == float('inf'): self.__pos_inf += 1
+        elif value == float('-inf'): self.__neg_inf += 1
+        else:
+            self.count += 1
+            delta = value - self.__mean
+            self.__mean += delta / self.count
+            self.__m2 += delta * (value - self.__mean)
+        if value == value:
+            self.__histogram[self.__bin(value)] += 1
+            while self.__minima and self.__minima[-1][1] >= value: self.__minima.pop()
+            while self.__maxima and self.__maxima[-1][1] <= value: self.__maxima.pop()
+            self.__minima.append((self.__pushed,value))
+            self.__maxima.append((self.__pushed,value))
+        self.__pushed += 1
+        for extremes in (self.__minima,self.__maxima):
+            while extremes and extremes[0][0] <= self.__pushed - 1 - self.capacity:
+                extremes.popleft()
+
+    def __remove(self,value):
+        if value != value: self.__nan -= 1
+        elif value == float('inf'): self.__pos_inf -= 1
+        elif value == float('-inf'): self.__neg_inf -= 1
+        else:
+            self.count -= 1
+            if self.count == 0:
+                self.__mean = self.__m2 = 0.0
+            else:
+                delta = value - self.__mean
+                self.__mean -= delta / self.count
+                self.__m2 -= delta * (value - self.__mean)
+        if value == value:
+            self.__histogram[self.__bin(value)] -= 1
+
+    def reset(self,window):
+        # Starts over from the entries of `window`
+        self.__init__(self.capacity,self.max_value,self.bins)
+        for value in window:
+            self.push(value)
+
+    def refresh(self,window):
+        # Recompute mean and m2 exactly from the window, so rounding errors of add/remove can't accumulate
+        finite = window[np.isfinite(window)]
+        self.__mean = float(finite.mean()) if len(finite) else 0.0
+        self.__m2 = float(((finite - self.__mean)**2).sum())
+
+    def mean(self):
+        if self.__nan or (self.__neg_inf and self.__pos_inf) or not (self.count or self.__neg_inf or self.__pos_inf):
+            return float('nan')
+        if self.__neg_inf: return float('-inf')
+        if self.__pos_inf: return float('inf')
+        return self.__mean
+
+    def var(self,ddof=0):
+        if self.__nan or self.__neg_inf or self.__pos_inf or self.count - ddof <= 0:
+            return float('nan')
+        if self.__minima[0][1] == self.__maxima[0][1]:
+            return 0.0  # all equal; don't report the rounding residue left in m2
+        return max(self.__m2,0.0) / (self.count - ddof)
+
+    def std(self,ddof=0):
+        return self.var(ddof) ** 0.5
+
+    def min(self):
+        if self.__nan or not self.__minima: return float('nan')
+        return self.__minima[0][1]
+
+    def max(self):
+        if self.__nan or not self.__maxima: return float('nan')
+        return self.__maxima[0][1]
+
+    def __estimate(self,cumulative,rank):
+        # Estimated value of the entry with this (whole) rank, its bin's entries taken as evenly spread over the bin
+        if rank == 0: return self.min()
+        if rank == cumulative[-1] - 1: return self.max()
+        b = int(np.searchsorted(cumulative,rank,side='right'))
+        if b == 0: return self.min()
+        if b == self.bins + 1: return self.max()
+        below = cumulative[b-1]
+        return (b - 1 + (rank - below + 0.5) / self.__histogram[b]) * self.max_value / self.bins
+
+    def quantile(self,q):
+        # Approximate q-quantile: linear between the estimates of the two entries around rank q * (n - 1), as numpy
+        # does between the entries themselves, so sparse windows interpolate across bins. Always within [min, max].
+        total = self.__histogram.sum()
+        if self.__nan or total == 0: return float('nan')
+        cumulative = np.cumsum(self.__histogram)
+        rank = q * (total - 1)
+        low = int(rank)
+        value = self.__estimate(cumulative,low)
+        if rank > low:
+            upper = self.__estimate(cumulative,low + 1)
+            if value == float('-inf') or upper == float('inf'):
+                return value if value == float('-inf') else upper  # between an infinite entry and another
+            value += (rank - low) * (upper - value)
+        return float(min(max(value,self.min()),self.max()))
+
+class RingBuffer:
+    '''
+    Fixed-capacity bid history backed by a numpy array.
+    Every entry is written twice (at i and i + capacity) so the newest entries are always one contiguous slice.
+    With a width, each entry is a row of `width` values (one per auction) and windows have shape (width, size).
+    Single-auction buffers also keep RollingStats of their window.
+    The array can live in a shared memory buffer (`memory`) that other processes follow with sync(). `slack` extra
+    slots keep entries around after they leave the window, so a follower up to `slack` appends behind can catch up;
+    one further behind starts over from the newest window.
+    '''
+
+    def __init__(self,capacity,width=None,max_value=100,slack=0,memory=None):
+        self.capacity = capacity
+        self.size = 0
+        self.appended = 0
+        self.__head = 0
+        self.__length = capacity + slack  # slots in one half of the array
+        shape = (2*self.__length,) if width is None else (width,2*self.__length)
+        self.__data = np.zeros(shape) if memory is None else np.ndarray(shape,buffer=memory)
+        self.stats = RollingStats(capacity,max_value) if width is None and capacity > 0 else None
+
+    @staticmethod
+    def nbytes(capacity,width=None,slack=0):
+        # Size of the memory buffer a RingBuffer with these arguments needs
+        return 8*2*(capacity + slack)*(width or 1)
+
+    def append(self,value):
+        if self.capacity == 0: return
+        evicted = None
+        if self.stats is not None and self.size == self.capacity:
+            evicted = self.__data[(self.__head - self.capacity) % self.__length]
+        self.__data[...,self.__head] = value
+        self.__data[...,self.__head + self.__length] = value
+        self.__advance(value,evicted)
+
+    def sync(self,appended):
+        # Takes in the entries another process appended to the shared memory until it holds `appended` in total
+        if appended - self.appended > self.__length - self.capacity:
+            # The entries in between (or those they evicted) are overwritten already: skip to the newest window
+            self.__head = appended % self.__length
+            self.appended = appended
+            self.size = min(self.capacity,appended)
+            if self.stats is not None:
+                self.stats.reset(self.window())
+            return
+        while self.appended < appended:
+            evicted = None
+            if self.stats is not None and self.size == self.capacity:
+                evicted = self.__data[(self.__head - self.capacity) % self.__length]
+            self.__advance(self.__data[...,self.__head],evicted)
+
+    def __advance(self,value,evicted):
+        self.__head = (self.__head + 1) % self.__length
+        self.appended += 1
+        if self.size < self.capacity: self.size += 1
+        if self.stats is not None:
+            self.stats.push(value,evicted)
+            if self.appended % self.capacity == 0:
+                self.stats.refresh(self.window())  # once per capacity appends, so amortized O(1)
+
+    def window(self,size=None):
+        # Read-only array of the newest `size` entries, oldest first. No data is copied.
+        size = self.size if size is None else min(size,self.size)
+        end = self.__head + self.__length  # the second half mirrors the first, so the newest entries end here
+        window = self.__data[...,end-size:end]
+        window.flags.writeable = False
+        return window
+
+class HistoryView:
+    '''
+    Live read-only view of a RingBuffer, handed to strategies in place of a list.
+    Supports len(), truth testing, indexing, slicing, iteration and numpy functions (np.mean, np.std, ...).
+    For a RingBuffer with a width, `row` selects the auction whose history is viewed.
+    `stats` gives O(1) rolling statistics of the window; numpy functions read the window itself and stay exact.
+    '''
+    __slots__ = ('buffer','size','row')
+
+    def __init__(self,buffer,size=None,row=None):
+        self.buffer = buffer
+        self.size = buffer.capacity if size is None else size
+        self.row = row
+
+    def window(self):
+        window = self.buffer.window(self.size)
+        return window if self.row is None else window[self.row]
+
+    def __len__(self):
+        return min(self.size,self.buffer.size)
+
+    def __getitem__(self,index):
+        if isinstance(index,slice):
+            return self.window()[index].tolist()
+        return float(self.window()[index])
+
+    def __iter__(self):
+        return iter(self.window().tolist())
+
+    def __array__(self,dtype=None,copy=None):
+        window = self.window()
+        if copy or (dtype is not None and window.dtype != dtype):
+            return np.array(window,dtype=dtype)
+        return window
+
+    def tolist(self):
+        return self.window().tolist()
+
+    @property
+    def stats(self):
+        # The buffer's RollingStats (O(1) mean, var, std, min, max and an approximate quantile) when the view spans
+        # the whole buffer, None otherwise. Opt-in: numpy functions on the view itself stay exact.
+        if self.row is None and self.size >= self.buffer.capacity:
+            return self.buffer.stats
+
+    def __repr__(self):
+        return f"HistoryView({self.tolist()})"
+
+class RoundHistory:
+    '''
+    Columnar store of round results, owned by the Auction and recorded once per round.
+    Each column is a RingBuffer; helpers read it through HistoryViews sized to their own info_size.
+    With a width, every column holds one history per auction and record() takes arrays of that length.
+    A shared history keeps its columns in shared memory, which worker processes map with attach() and follow
+    with sync(), so strategies in other processes read the same arrays without anything being copied.
+    '''
+
+    def __init__(self,capacity,width=None,max_value=100,shared=False,names=None):
+        self.capacity = capacity
+        self.max_value = max_value
+        self.rounds = 0
+        self.memory = []  # SharedMemory blocks behind the columns of a shared history
+        self.__owner = shared and names is None
+        slack = capacity if shared else 0  # workers up to `capacity` rounds behind can still sync
+        columns = []
+        for i in range(2):
+            memory = None
+            if shared:
+                size = RingBuffer.nbytes(capacity,width,slack)
+                self.memory.append(shared_memory.SharedMemory(create=True,size=max(size,1)) if names is None else shared_memory.SharedMemory(names[i]))
+                memory = self.memory[-1].buf[:size]
+            columns.append(RingBuffer(capacity,width,max_value,slack,memory))
+        self.winners,self.second_highest = columns
+
+    @classmethod
+    def attach(cls,descriptor):
+        # Read-only follower of a shared history, from its descriptor()
+        capacity,max_value,names = descriptor
+        return cls(capacity,max_value=max_value,shared=True,names=names)
+
+    def descriptor(self):
+        return (self.capacity,self.max_value,[memory.name for memory in self.memory])
+
+    def record(self,winning_bid,second_highest_bid):
+        self.winners.append(winning_bid)
+        self.second_highest.append(second_highest_bid)
+        self.rounds += 1
+
+    def sync(self,rounds):
+        # Catches a follower up with the `rounds` rounds recorded by the owner
+        self.winners.sync(rounds)
+        self.second_highest.sync(rounds)
+        self.rounds = rounds
+
+    def unlink(self):
+        # Removes the shared memory once the owner is done with it; mappings stay valid until they are dropped
+        if self.__owner:
+            for memory in self.memory:
+                memory.unlink()
+            self.__owner = False
+
+    def view(self,column,size=None,row=None):
+        return HistoryView(getattr(self,column),size,row)
+
+class LatencyHistogram:
+    '''
+    Log-linear histogram of durations in nanoseconds: exact below 16ns, then 8 buckets per power of two (~12% wide).
+    Recording is a couple of integer operations, cheap enough to run on every bid. Buckets are kept sparse, since
+    one bot's latencies fall in a few dozen of them and an auction may have thousands of bots.
+    '''
+
+    def __init__(self):
+        self.counts = {}  # bucket index -> count
+        self.count = 0
+        self.total = 0  # ns
+        self.max = 0
+
+    def record(self,ns):
+        if ns < 16:
+            index = max(ns,0)
+        else:
+            shift = ns.bit_length() - 4
+            index = 8*shift + (ns >> shift)  # top 4 bits pick one of 8 buckets in this power of two
+        self.counts[index] = self.counts.get(index,0) + 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max: self.max = ns
+
+    def merge(self,other):
+        for index,count in other.counts.items():
+            self.counts[index] = self.counts.get(index,0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max,other.max)
+        return self
+
+    def quantile(self,q):
+        # Midpoint of the bucket holding the q-th quantile, in ns
+        if not self.count:
+            return 0.0
+        rank = q*(self.count - 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen > rank:
+                break
+        if index < 16:
+            return float(index)
+        shift = index//8 - 1
+        low = (index - 8*shift) << shift
+        return float(min(low + (1 << shift)/2,self.max))
+
+def object_size(obj,depth=3,seen=None):
+    '''
+    Rough deep size in bytes of an object and what it holds: numpy arrays count their data, containers their slots
+    plus their elements and instances their attributes, `depth` levels down. Long containers are estimated from
+    their first element, so measuring a bot that keeps a multi-million entry history stays cheap.
+    '''
+    seen = set() if seen is None else seen
+    if id(obj) in seen or isinstance(obj,(type,type(time),type(object_size))):
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj,np.ndarray):
+        return obj.nbytes + 112
+    size = sys.getsizeof(obj)
+    if depth <= 0:
+        return size
+    if isinstance(obj,dict):
+        items = list(obj.items())
+    elif isinstance(obj,(list,tuple,set,frozenset,deque)):
+        items = list(obj) if len(obj) <= 64 else None
+        if items is None:
+            first = next(iter(obj))
+            return size + len(obj)*object_size(first,depth - 1,set())
+    elif hasattr(obj,'__dict__'):
+        items = list(vars(obj).items())
+    else:
+        return size
+    return size + sum(object_size(item,depth - 1,seen) for item in items)
+
+def timing_report(helpers,run_time=None):
+    '''
+    Per-bot bid latency, slowest first: calls, p50 / p99 / max wall time, total wall and CPU time and, given the
+    run's wall time in seconds, the share of it spent in each bot. Helpers with the same name (one per auction in
+    MultiAuction) are merged into one row.
+    '''
+    merged = {}
+    for helper in helpers:
+        wall,cpu = merged.setdefault(helper.name,(LatencyHistogram(),LatencyHistogram()))
+        wall.merge(helper.wall_time)
+        cpu.merge(helper.cpu_time)
+    report = [{'name': name, 'calls': wall.count, 'p50': wall.quantile(0.5)/1e9, 'p99': wall.quantile(0.99)/1e9, 'max': wall.max/1e9,
+               'wall': wall.total/1e9, 'cpu': cpu.total/1e9, 'share': wall.total/1e9/run_time if run_time else None}
+              for name,(wall,cpu) in merged.items()]
+    return sorted(report,key=lambda row: row['wall'],reverse=True)
+
+def print_timing_report(report):
+    print("\nBid timings (slowest first):")
+    for row in report:
+        share = f", {row['share']:.1%} of run time" if row['share'] is not None else ""
+        print(f"{row['name']}: {row['calls']} calls, p50 = {row['p50']*1e6:.1f}us, p99 = {row['p99']*1e6:.1f}us, max = {row['max']*1e6:.1f}us, "
+              f"wall = {row['wall']:.3f}s, cpu = {row['cpu']:.3f}s{share}")
+
 class StrategyHelper:
     
-    def __init__(self,name,strategy,starting_capital,max_value,second_highest_fraction=0.3,log = True,info_size=100):
+    def __init__(self,name,strategy,starting_capital,max_value,second_highest_fraction=0.3,log = True,info_size=100,history=None,rng=None,history_row=None):
         self.log = log
         self.name = name
         self.strategy = strategy
-        self.capital = starting_capital
+        self.has_batch = type(strategy).make_bids_batch is not StrategyBase.make_bids_batch
+        self.has_round_callback = type(strategy).on_round_result is not StrategyBase.on_round_result
+        if rng is not None:
+            self.strategy.rng = rng
+        self.__capitals = np.array([starting_capital],dtype=float)
+        self.__index = 0
         self.max_value = max_value
-        self.previous_winners = []
-        self.previous_second_highest = []
+        # history is the RoundHistory shared by every bot in an auction, which records each round once.
+        # A standalone helper keeps its own and records it in update_capital.
+        self.__owns_history = history is None
+        self.history = RoundHistory(info_size,max_value=max_value) if history is None else history
+        self.previous_winners = self.history.view('winners',info_size,history_row)
+        self.previous_second_highest = self.history.view('second_highest',info_size,history_row)
         self.status=0
         self.second_highest_fraction = second_highest_fraction
+        self.wall_time = LatencyHistogram()  # per make_bid / make_bids_batch call, in ns
+        self.last_call = 0  # wall time of the latest call, in ns
+        self.raw_bid = None  # what the latest make_bid call returned, before is_valid_bid
+        self.__baseline_rss = None  # RSS of a worker process at its first memory_usage call
+        self.cpu_time = LatencyHistogram()
         self.info_size = info_size
 
+    @property
+    def capital(self):
+        return float(self.__capitals[self.__index])
+
+    @capital.setter
+    def capital(self,value):
+        self.__capitals[self.__index] = value
+
+    def bind_capital(self,capitals,index):
+        # Moves this bot's capital into slot `index` of an array owned by the auction's settlement engine
+        capitals[index] = self.capital
+        self.__capitals = capitals
+        self.__index = index
+
         
     def is_valid_bid(self,bid):
-        if not (isinstance(bid,float) or isinstance(bid,int)) or bid is None:
-            return -1 # invalid return
+        if not isinstance(bid,numbers.Real):
+            return -1 # invalid return (numpy scalars are real numbers too)
         elif bid < 0 or bid > self.max_value:
             return -2 # out of range
         elif bid > self.capital:
@@ -43,10 +506,55 @@ class StrategyHelper:
     def bid(self,current_value,num_bidders):
         self.value = current_value
 
+        if self.has_batch:
+            bids = self.bid_batch(np.array([current_value]),np.asarray(self.previous_winners)[None],np.asarray(self.previous_second_highest)[None],np.array([self.capital]),np.array([num_bidders]))
+            self.bid_value = self.raw_bid = float(bids[0])
+            return self.bid_value
+
+        wall,cpu = time.perf_counter_ns(),time.thread_time_ns()
         bid = self.strategy.make_bid(self.value,self.previous_winners,self.previous_second_highest,self.capital,num_bidders)
+        self.cpu_time.record(time.thread_time_ns() - cpu)
+        self.last_call = time.perf_counter_ns() - wall
+        self.wall_time.record(self.last_call)
         # bid = self.strategy.make_bid(current_value,self.previous_winners,self.previous_second_highest,self.capital,num_bidders)
+        self.raw_bid = bid
         self.bid_value = self.is_valid_bid(bid)
         return self.bid_value
+
+    def invalid_bid(self):
+        # repr of the latest make_bid return value if it isn't a number (or is NaN), None if it is one
+        if not isinstance(self.raw_bid,numbers.Real) or self.raw_bid != self.raw_bid:
+            return repr(self.raw_bid)
+
+    def notify(self,winning_bid,second_highest_bid,epsilon=0.01):
+        # Sends this round's result to the strategy's on_round_result; called once capitals are settled
+        won = abs(self.bid_value - winning_bid) < epsilon
+        second = not won and abs(self.bid_value - second_highest_bid) < epsilon
+        self.strategy.on_round_result(winning_bid,second_highest_bid,RoundOutcome(self.bid_value,self.value,self.capital,won,second))
+
+    def memory_usage(self):
+        # Memory this bot uses in bytes: how much its worker process's RSS has grown since the first call (once the
+        # worker has started, so the interpreter and numpy don't count), or an estimate of the strategy object in process
+        pid = getattr(self.strategy,'pid',None)
+        if pid is not None:
+            try:
+                rss = psutil.Process(pid).memory_info().rss
+            except psutil.Error:
+                return 0
+            if self.__baseline_rss is None:
+                self.__baseline_rss = rss
+            return rss - self.__baseline_rss
+        return object_size(self.strategy)
+
+    def bid_batch(self,current_values,previous_winners,previous_second_highest,capitals,num_bidders):
+        # Vectorized is_valid_bid: -2 when out of range, capped at the capital left in each auction
+        wall,cpu = time.perf_counter_ns(),time.thread_time_ns()
+        bids = self.strategy.make_bids_batch(current_values,previous_winners,previous_second_highest,capitals,num_bidders)
+        self.cpu_time.record(time.thread_time_ns() - cpu)
+        self.last_call = time.perf_counter_ns() - wall
+        self.wall_time.record(self.last_call)
+        bids = np.asarray(bids,dtype=float)
+        return np.where((bids < 0) | (bids > self.max_value),-2,np.minimum(bids,capitals))
     
 
     # What all i need. Am i highest, am i second highest, max of all values, winning bid, second winning bid
@@ -56,18 +564,18 @@ class StrategyHelper:
             self.capital += winning_value - highest_bid
         elif second:
             self.capital -= min(self.capital,self.second_highest_fraction*max(0,winning_value-highest_bid))
-        self.previous_winners.append(highest_bid)
-        self.previous_second_highest.append(second_highest_bid)
-        if len(self.previous_winners) > self.info_size:
-            self.previous_winners.pop(0)
-            self.previous_second_highest.pop(0)
+        if self.__owns_history:
+            self.history.record(highest_bid,second_highest_bid)
 
         if self.log:
-            print(f"{self.name}: bid - {self.bid_value:.2f}, initial_capital - {capital_at_start_of_round:.2f}, value - {self.value:.2f}, capital left - {self.capital:.2f} ")
+            self.log_round(capital_at_start_of_round)
         
         if capital_at_start_of_round>0 and self.capital<=0: #Bot just died
             if self.log: print(f"{self.name} just ran out of capital!")
             self.bid_value = float('-inf')
             self.capital=0
             return 1 # indicates that this bidder can no longer participate in the auction
-        else: return 0 
\ No newline at end of file
+        else: return 0 
+
+    def log_round(self,capital_at_start_of_round):
+        print(f"{self.name}: bid - {self.bid_value:.2f}, initial_capital - {capital_at_start_of_round:.2f}, value - {self.value:.2f}, capital left - {self.capital:.2f} ")
\ No newline at end of file
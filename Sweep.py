@@ -0,0 +1,213 @@
+import os
+import csv
+import time
+import heapq
+import queue
+import argparse
+import itertools
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from Auction import format_failure
+from Distributions import DISTRIBUTIONS
+from Tournament import run_seed, summarize_profits
+
+# Auction parameters a sweep can vary, with the defaults used for the ones it doesn't
+PARAMETERS = {'round_count': 1000, 'starting_capital': 500, 'max_value': 100, 'second_highest_fraction': 0,
+              'type': 'self', 'info_size': 100, 'distribution': 'uniform'}
+COLUMNS = ['point'] + list(PARAMETERS) + ['seed', 'bot', 'profit', 'rank', 'failures']
+
+
+def grid(**axes):
+    # Every combination of the given values, e.g. grid(second_highest_fraction=np.linspace(0, 1, 11), type=['self', 'max'])
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[name] for name in names))]
+
+
+def random_points(count, seed=None, **space):
+    '''
+    `count` points drawn from `space`: a (low, high) tuple is sampled uniformly (as integers when both bounds are
+    ints) and a list is sampled from as choices. Any other value is used as is.
+    '''
+    rng = np.random.default_rng(seed)
+    points = [{} for _ in range(count)]
+    for name, axis in space.items():
+        if isinstance(axis, tuple):
+            low, high = axis
+            values = rng.integers(low, high, count, endpoint=True) if isinstance(low, int) and isinstance(high, int) else rng.uniform(low, high, count)
+            values = values.tolist()
+        elif isinstance(axis, list):
+            values = [axis[i] for i in rng.integers(len(axis), size=count)]
+        else:
+            values = [axis] * count
+        for point, value in zip(points, values):
+            point[name] = value
+    return points
+
+
+def run_chunk(strategy_folder, tasks, results, cache=None):
+    # Runs a batch of (point, auction_args, seed) tasks in a worker process, putting (point, seed, result) on the
+    # `results` queue as each run finishes
+    for point, auction_args, seed in tasks:
+        results.put((point, seed, run_seed(strategy_folder, seed, auction_args, cache)))
+
+
+def balance(tasks, chunks):
+    '''
+    Splits tasks into at most `chunks` batches of about equal cost, estimated as each task's round count: tasks are
+    dealt longest first to the currently lightest batch. Batches come back heaviest first so they start first.
+    '''
+    heap = [(0, i, []) for i in range(min(chunks, len(tasks)))]
+    for task in sorted(tasks, key=lambda task: -task[1]['round_count']):
+        cost, i, chunk = heapq.heappop(heap)
+        chunk.append(task)
+        heapq.heappush(heap, (cost + task[1]['round_count'], i, chunk))
+    return [chunk for _, _, chunk in sorted(heap, key=lambda entry: -entry[0])]
+
+
+class Sweep:
+    '''
+    Runs a strategy folder over a list of Auction parameter points (see grid and random_points), each with the same
+    seeds, on a process pool. Results arrive as a tidy table: one row per point, seed and bot, with the bot's final
+    profit and its rank in that run (1 is best, ties share the better rank). Rows are yielded by iter_rows as each
+    run finishes and can be streamed to a CSV file.
+    '''
+
+    def __init__(self, strategy_folder, points, seeds, workers=None, cache=None):
+        self.strategy_folder = strategy_folder
+        self.points = [dict(PARAMETERS, **point) for point in points]
+        unknown = {name for point in points for name in point} - set(PARAMETERS)
+        if unknown:
+            raise ValueError(f"Can't sweep {', '.join(sorted(unknown))}. Sweepable parameters: {', '.join(PARAMETERS)}")
+        self.seeds = list(range(seeds)) if isinstance(seeds, int) else list(seeds)
+        self.workers = workers or os.cpu_count()
+        self.cache = cache  # ResultCache directory, or None to always simulate
+        self.rows = []
+        self.failures = []  # (point, seed, Failure) for every problem contained during the runs
+
+    def tasks(self):
+        return [(i, point, seed) for i, point in enumerate(self.points) for seed in self.seeds]
+
+    def iter_runs(self):
+        # Yields the rows of each run as soon as it finishes. Work is handed out in a few balanced batches per
+        # worker, which keeps every worker busy to the end; results come back one run at a time over a queue.
+        tasks = self.tasks()
+        chunks = balance(tasks, 4 * self.workers)
+        with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=self.workers) as executor:
+            results = manager.Queue()
+            futures = [executor.submit(run_chunk, self.strategy_folder, chunk, results, self.cache) for chunk in chunks]
+            for _ in tasks:
+                while True:
+                    try:
+                        point, seed, result = results.get(timeout=1)
+                        break
+                    except queue.Empty:
+                        for future in futures:
+                            if future.done() and future.exception():
+                                raise future.exception()  # a batch died without reporting all its runs
+                yield self.__rows(point, seed, result)
+
+    def iter_rows(self):
+        for rows in self.iter_runs():
+            yield from rows
+
+    def __rows(self, point, seed, result):
+        names, profits, failures = result
+        self.failures += [(point, seed, failure) for failure in failures]
+        if names is None:
+            return []  # the run couldn't even start
+        profits = np.array(profits)
+        ranks = 1 + (profits[None, :] > profits[:, None]).sum(axis=1)
+        rows = [dict(self.points[point], point=point, seed=seed, bot=name, profit=profit, rank=rank,
+                     failures=sum(failure.bot == name for failure in failures))
+                for name, profit, rank in zip(names, profits.tolist(), ranks.tolist())]
+        self.rows += rows
+        return rows
+
+    def run(self, output=None, verbose=True):
+        # Runs the sweep, appending rows to `output` (a CSV path) as they arrive
+        self.rows, self.failures = [], []
+        file = open(output, 'w', newline='') if output else None
+        try:
+            writer = csv.DictWriter(file, COLUMNS) if file else None
+            if writer:
+                writer.writeheader()
+            total = len(self.points) * len(self.seeds)
+            for runs, rows in enumerate(self.iter_runs(), 1):
+                if writer:
+                    writer.writerows(rows)
+                if runs % max(1, total // 20) == 0:
+                    if file:
+                        file.flush()
+                    if verbose:
+                        print(f"{runs}/{total} runs done")
+        finally:
+            if file:
+                file.close()
+        return self.summary()
+
+    def summary(self):
+        # Per point: mean and std of profit, win rate and mean rank of every bot
+        summary = []
+        for point in range(len(self.points)):
+            rows = sorted((row for row in self.rows if row['point'] == point), key=lambda row: row['seed'])
+            names = list(dict.fromkeys(row['bot'] for row in rows))
+            if not names:
+                summary.append([])
+                continue
+            profits = np.array([row['profit'] for row in rows]).reshape(-1, len(names))
+            ranks = np.array([row['rank'] for row in rows]).reshape(-1, len(names))
+            summary.append([dict(result, mean_rank=mean_rank) for result, mean_rank in zip(summarize_profits(names, profits), ranks.mean(axis=0))])
+        return summary
+
+    def print_results(self):
+        varied = [name for name in PARAMETERS if len({point[name] for point in self.points}) > 1]
+        for point, results in zip(self.points, self.summary()):
+            label = ', '.join(f"{name}={point[name]:.4g}" if isinstance(point[name], float) else f"{name}={point[name]}" for name in varied) or 'defaults'
+            print(f"\n{label}:")
+            for result in sorted(results, key=lambda result: result['mean_rank']):
+                print(f"  {result['name']}: Mean Rank = {result['mean_rank']:.2f}, Mean Profit = {result['mean']:.2f}, Win Rate = {result['win_rate']:.1%}")
+        if self.failures:
+            print(f"\n{len(self.failures)} failure(s):")
+        for point, seed, failure in self.failures:
+            print(f"Point {point}, seed {seed}, {format_failure(failure)}")
+
+
+if __name__=='__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('folder', help='Strategy folder to evaluate')
+    parser.add_argument('-seeds', type=int, default=20, help='Seeded auctions per point')
+    parser.add_argument('-rounds', type=int, nargs='+', default=[1000], help='Rounds per auction')
+    parser.add_argument('-capital', type=float, nargs='+', default=[500], help='Starting capital')
+    parser.add_argument('-fraction', type=float, nargs='+', default=[0], help='Second highest fraction')
+    parser.add_argument('-type', nargs='+', default=['self'], choices=['self', 'max'], help='Auction type')
+    parser.add_argument('-distribution', nargs='+', default=['uniform'], choices=[name for name in DISTRIBUTIONS if name != 'empirical'], help='Value distribution')
+    parser.add_argument('-steps', type=int, default=None, help='Replace each numeric axis given as LOW HIGH by this many evenly spaced values')
+    parser.add_argument('-random', type=int, default=None, help='Sample this many points instead of the full grid, numeric axes given as LOW HIGH ranges')
+    parser.add_argument('-sample_seed', type=int, default=None, help='Seed for -random')
+    parser.add_argument('-output', default=None, help='CSV file to stream rows to')
+    parser.add_argument('-workers', type=int, default=None, help='Worker processes (default: one per core)')
+    parser.add_argument('-cache', default=None, help='Directory to cache results in, so unchanged runs are not recomputed')
+    args = parser.parse_args()
+    axes = {'round_count': args.rounds, 'starting_capital': args.capital, 'second_highest_fraction': args.fraction,
+            'type': args.type, 'distribution': args.distribution}
+    numeric = ['round_count', 'starting_capital', 'second_highest_fraction']
+    if args.random:
+        space = {name: (tuple(axis) if name in numeric and len(axis) == 2 else axis) for name, axis in axes.items()}
+        points = random_points(args.random, args.sample_seed, **space)
+        points = [dict(point, round_count=int(point['round_count'])) for point in points]
+    else:
+        if args.steps:
+            for name in numeric:
+                if len(axes[name]) == 2:
+                    axes[name] = np.linspace(*axes[name], args.steps).tolist()
+            axes['round_count'] = sorted({int(round_count) for round_count in axes['round_count']})
+        points = grid(**axes)
+    start = time.time()
+    sweep = Sweep(args.folder, points, args.seeds, workers=args.workers, cache=args.cache)
+    sweep.run(args.output)
+    sweep.print_results()
+    if args.output:
+        print(f"Rows written to {args.output}")
+    end = time.time()
+    print(f"Execution time: {end-start:0.3f}")
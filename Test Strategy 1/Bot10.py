@@ -96,3 +96,29 @@ class AdvancedUserStrategy(StrategyBase):
         self.capital_history.append(capital)
 
         return bid
+
+    def make_bids_batch(self, current_values, previous_winners, previous_second_highest_bids, capitals, num_bidders):
+        '''
+        make_bid for many independent auctions at once. Aggression (alpha) is tracked per auction.
+        '''
+        if len(getattr(self, 'batch_alpha', ())) != len(current_values):
+            self.batch_alpha = np.full(len(current_values), 0.2)
+
+        if previous_winners.shape[1]:
+            mean_highest_bid, std_highest_bid = previous_winners.mean(axis=1), previous_winners.std(axis=1)
+        else:
+            mean_highest_bid, std_highest_bid = 0, 1
+        if previous_second_highest_bids.shape[1]:
+            mean_second_highest_bid, std_second_highest_bid = previous_second_highest_bids.mean(axis=1), previous_second_highest_bids.std(axis=1)
+        else:
+            mean_second_highest_bid, std_second_highest_bid = 0, 1
+
+        predicted_highest = mean_highest_bid + self.batch_alpha * std_highest_bid
+        predicted_second_highest = mean_second_highest_bid + self.batch_alpha * std_second_highest_bid
+
+        bids = predicted_second_highest + (predicted_highest - predicted_second_highest) * self.bid_adjustment_factor
+        bids = np.maximum(np.minimum(np.minimum(bids, capitals), current_values - self.safety_margin), 0.1)
+
+        self.batch_alpha = np.where(capitals > 100, np.minimum(0.9, self.batch_alpha + self.alpha_adjustment),
+                                    np.where(capitals < 30, np.maximum(0.1, self.batch_alpha - self.alpha_adjustment), self.batch_alpha))
+        return bids
@@ -21,8 +21,8 @@ class AdvancedUserStrategy(StrategyBase):
     def estimate_opponent_bids(self, previous_winners, previous_second_highest_bids):
         mean = self.model_params['mean']
         std = self.model_params['std']
-        predicted_highest = np.random.normal(mean, std)
-        predicted_second_highest = np.random.normal(mean, std)
+        predicted_highest = self.rng.normal(mean, std)
+        predicted_second_highest = self.rng.normal(mean, std)
         return predicted_highest, predicted_second_highest
 
     def calculate_optimal_bid(self, current_value, predicted_highest, predicted_second_highest, capital):
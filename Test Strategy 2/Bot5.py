@@ -49,8 +49,8 @@ class BayesianGameTheoryStrategy(StrategyBase):
         std_second_highest = self.std_second_highest
         
         # Predict the highest and second-highest bids
-        predicted_max_bid = norm.rvs(loc=mean_highest, scale=std_highest)
-        predicted_second_highest_bid = norm.rvs(loc=mean_second_highest, scale=std_second_highest)
+        predicted_max_bid = norm.rvs(loc=mean_highest, scale=std_highest, random_state=self.rng)
+        predicted_second_highest_bid = norm.rvs(loc=mean_second_highest, scale=std_second_highest, random_state=self.rng)
         
         return predicted_max_bid, predicted_second_highest_bid
 
@@ -61,8 +61,8 @@ class AdaptiveBayesianStrategy(StrategyBase):
         std_second_highest = max(std_second_highest, 1e-5)
         
         # Predict the highest and second-highest bids
-        predicted_max_bid = norm.rvs(loc=mean_highest, scale=std_highest)
-        predicted_second_highest_bid = norm.rvs(loc=mean_second_highest, scale=std_second_highest)
+        predicted_max_bid = norm.rvs(loc=mean_highest, scale=std_highest, random_state=self.rng)
+        predicted_second_highest_bid = norm.rvs(loc=mean_second_highest, scale=std_second_highest, random_state=self.rng)
         
         return predicted_max_bid, predicted_second_highest_bid
 
@@ -52,8 +52,8 @@ class HybridBayesianRLStrategy(StrategyBase):
         std_second_highest = self.std_second_highest
         
         # Predict the highest and second-highest bids
-        predicted_max_bid = norm.rvs(loc=mean_highest, scale=std_highest)
-        predicted_second_highest_bid = norm.rvs(loc=mean_second_highest, scale=std_second_highest)
+        predicted_max_bid = norm.rvs(loc=mean_highest, scale=std_highest, random_state=self.rng)
+        predicted_second_highest_bid = norm.rvs(loc=mean_second_highest, scale=std_second_highest, random_state=self.rng)
         
         return predicted_max_bid, predicted_second_highest_bid
 
@@ -92,12 +92,12 @@ class HybridBayesianRLStrategy(StrategyBase):
         '''
         Choose an action based on the exploration-exploitation trade-off.
         '''
-        if np.random.rand() < self.exploration_prob:
-            return np.random.choice(available_actions)
+        if self.rng.random() < self.exploration_prob:
+            return self.rng.choice(available_actions)
         else:
             q_values = [self.q_values.get(state, {}).get(a, 0) for a in available_actions]
             max_q = max(q_values, default=0)
-            return np.random.choice([a for a, q in zip(available_actions, q_values) if q == max_q])
+            return self.rng.choice([a for a, q in zip(available_actions, q_values) if q == max_q])
 
     def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
         '''
@@ -50,8 +50,8 @@ class AdaptiveRiskAdjustedStrategy(StrategyBase):
         std_second_highest = self.std_second_highest
         
         # Generate predictions for the highest and second-highest bids
-        predicted_max_bid = np.random.normal(loc=mean_highest, scale=std_highest)
-        predicted_second_highest_bid = np.random.normal(loc=mean_second_highest, scale=std_second_highest)
+        predicted_max_bid = self.rng.normal(loc=mean_highest, scale=std_highest)
+        predicted_second_highest_bid = self.rng.normal(loc=mean_second_highest, scale=std_second_highest)
         
         return predicted_max_bid, predicted_second_highest_bid
 
@@ -49,11 +49,11 @@ class ProbabilisticRiskAdjustedStrategy(StrategyBase):
         std_second_highest = self.std_second_highest
         
         # Generate predictions for the highest and second-highest bids
-        predicted_max_bid = np.random.normal(loc=mean_highest, scale=std_highest)
-        predicted_second_highest_bid = np.random.normal(loc=mean_second_highest, scale=std_second_highest)
+        predicted_max_bid = self.rng.normal(loc=mean_highest, scale=std_highest)
+        predicted_second_highest_bid = self.rng.normal(loc=mean_second_highest, scale=std_second_highest)
         
         # Consider potential outliers by adding variability
-        variability = np.random.normal(scale=0.1, size=2)
+        variability = self.rng.normal(scale=0.1, size=2)
         predicted_max_bid += variability[0]
         predicted_second_highest_bid += variability[1]
         
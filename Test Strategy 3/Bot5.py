@@ -52,8 +52,8 @@ class ProbabilisticBidStrategy(StrategyBase):
         aggression_factor = self.initial_aggression * (1 - self.round_number / 1000) + self.aggression_decay * (capital / 100)
         
         # Estimate the range of potential winning bids
-        predicted_max_bid = mean_winner + std_winner * np.random.randn()
-        predicted_second_highest_bid = mean_second_highest + std_second_highest * np.random.randn()
+        predicted_max_bid = mean_winner + std_winner * self.rng.standard_normal()
+        predicted_second_highest_bid = mean_second_highest + std_second_highest * self.rng.standard_normal()
 
         # Base bid calculation
         base_bid = predicted_second_highest_bid + (predicted_max_bid - predicted_second_highest_bid) * aggression_factor
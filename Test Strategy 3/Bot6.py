@@ -46,10 +46,10 @@ class AdvancedBidStrategy(StrategyBase):
         Calculate the optimal bid with probabilistic adjustment and risk management.
         '''
         # Estimate potential maximum value (X)
-        predicted_max_value = mean_winner + std_winner * np.random.randn()
+        predicted_max_value = mean_winner + std_winner * self.rng.standard_normal()
 
         # Estimate potential second-highest bid
-        predicted_second_highest_bid = mean_second_highest + std_second_highest * np.random.randn()
+        predicted_second_highest_bid = mean_second_highest + std_second_highest * self.rng.standard_normal()
 
         # Aggression factor with decay
         aggression_factor = max(self.initial_aggression - self.aggression_decay * self.round_number, 0.1)
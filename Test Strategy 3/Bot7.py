@@ -46,8 +46,8 @@ class CombinedBidStrategy(StrategyBase):
         '''
         Calculate a bid based on probabilistic modeling.
         '''
-        predicted_max_value = norm.rvs(loc=mean_winner, scale=std_winner)
-        predicted_second_highest_bid = norm.rvs(loc=mean_second_highest, scale=std_second_highest)
+        predicted_max_value = norm.rvs(loc=mean_winner, scale=std_winner, random_state=self.rng)
+        predicted_second_highest_bid = norm.rvs(loc=mean_second_highest, scale=std_second_highest, random_state=self.rng)
         
         return predicted_max_value, predicted_second_highest_bid
 
@@ -0,0 +1,96 @@
+import os
+import time
+import argparse
+import traceback
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from Auction import Failure, format_failure
+from Distributions import DISTRIBUTIONS
+from ResultCache import open_cache, run_cached
+
+
+def run_seed(strategy_folder, seed, auction_args, cache=None):
+    # Runs one seeded auction in the current (worker) process and returns the bot names, final profits and failures.
+    # Faults are contained, so one broken bot costs its own disqualification rather than the whole sweep.
+    # With a cache directory, runs already done with the same sources and parameters are read back instead.
+    try:
+        results = run_cached(strategy_folder, seed, dict(auction_args, contain_faults=True), open_cache(cache) if cache else None)
+    except Exception:
+        return None, None, [Failure(0, None, 'exception', traceback.format_exc())]
+    return results['names'], results['final_profits'], [Failure(**failure) for failure in results['failures']]
+
+
+def summarize_profits(names, profits):
+    # Mean, standard deviation and win rate (share of runs with the top profit, ties included) per bot
+    # profits has one row per run and one column per bot
+    if len(profits) == 0:
+        return []
+    wins = profits == profits.max(axis=1, keepdims=True)
+    return [{'name': name, 'mean': mean, 'std': std, 'win_rate': win_rate}
+            for name, mean, std, win_rate in zip(names, profits.mean(axis=0), profits.std(axis=0), wins.mean(axis=0))]
+
+
+def print_summary(summary, runs):
+    print(f"\nResults over {runs} runs:")
+    for i, result in enumerate(summary):
+        print(f"Bot {i+1} ({result['name']}): Mean Profit = {result['mean']:.2f}, Std = {result['std']:.2f}, Win Rate = {result['win_rate']:.1%}")
+
+
+class Tournament:
+    '''
+    Runs independent seeded Auctions of one strategy folder on a process pool and aggregates the final profits.
+    '''
+
+    def __init__(self, strategy_folder, seeds, round_count, starting_capital, max_value, second_highest_fraction, type='self', info_size=100, distribution='uniform', workers=None, cache=None):
+        self.strategy_folder = strategy_folder
+        self.seeds = list(range(seeds)) if isinstance(seeds, int) else list(seeds)
+        self.auction_args = dict(round_count=round_count, starting_capital=starting_capital, max_value=max_value,
+                                 second_highest_fraction=second_highest_fraction, type=type, info_size=info_size,
+                                 distribution=distribution)
+        self.workers = workers or os.cpu_count()
+        self.cache = cache  # ResultCache directory, or None to always simulate
+        self.names = []
+        self.profits = np.empty((0, 0))  # one row per seed, one column per bot
+        self.failures = []  # (seed, Failure) for every problem contained during the runs
+
+    def run(self):
+        # Chunk the seeds so each worker gets a few batches; one task per seed is too chatty for 10k-seed sweeps
+        chunksize = max(1, len(self.seeds) // (4 * self.workers))
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(run_seed, [self.strategy_folder] * len(self.seeds), self.seeds,
+                                        [self.auction_args] * len(self.seeds), [self.cache] * len(self.seeds), chunksize=chunksize))
+        self.failures = [(seed, failure) for seed, (_, _, failures) in zip(self.seeds, results) for failure in failures]
+        results = [result for result in results if result[0] is not None]  # runs that couldn't even start
+        self.names = results[0][0] if results else []
+        self.profits = np.array([profits for _, profits, _ in results])
+        return self.summary()
+
+    def summary(self):
+        return summarize_profits(self.names, self.profits)
+
+    def print_results(self):
+        print_summary(self.summary(), len(self.profits))
+        if self.failures:
+            print(f"\n{len(self.failures)} failure(s):")
+        for seed, failure in self.failures:
+            print(f"Seed {seed}, {format_failure(failure)}")
+
+
+if __name__=='__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('folder', help='Strategy folder to evaluate')
+    parser.add_argument('-seeds', type=int, default=100, help='Number of seeded auctions')
+    parser.add_argument('-rounds', type=int, default=1000, help='Rounds per auction')
+    parser.add_argument('-capital', type=float, default=500, help='Starting capital')
+    parser.add_argument('-fraction', type=float, default=0, help='Second highest fraction')
+    parser.add_argument('-type', default='self', choices=['self', 'max'], help='Auction type')
+    parser.add_argument('-distribution', default='uniform', choices=[name for name in DISTRIBUTIONS if name != 'empirical'], help='Value distribution')
+    parser.add_argument('-workers', type=int, default=None, help='Worker processes (default: one per core)')
+    parser.add_argument('-cache', default=None, help='Directory to cache results in, so unchanged runs are not recomputed')
+    args = parser.parse_args()
+    start = time.time()
+    tournament = Tournament(args.folder, args.seeds, args.rounds, args.capital, 100, args.fraction, type=args.type, distribution=args.distribution, workers=args.workers, cache=args.cache)
+    tournament.run()
+    tournament.print_results()
+    end = time.time()
+    print(f"Execution time: {end-start:0.3f}")
@@ -8,10 +8,20 @@ starting_capital = 500
 if __name__=='__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('-log', action='store_true', help='Enable logging')
+    parser.add_argument('-seed', type=int, default=None, help='Seed for a reproducible run')
+    parser.add_argument('-event_log', default=None, help='Write a binary event log to this file (read it with EventLog.py)')
+    parser.add_argument('-timings', action='store_true', help='Print per-bot bid latency')
+    parser.add_argument('-workers', action='store_true', help='Run every bot in its own process')
+    parser.add_argument('-checkpoint', default=None, help='Checkpoint the run to this file every minute (resume with Checkpoint.py)')
+    parser.add_argument('-contain', action='store_true', help='Disqualify bots that raise or return None / NaN instead of stopping')
+    parser.add_argument('-time_limit', type=float, default=None, help='Seconds a make_bid call may take')
+    parser.add_argument('-memory_limit', type=float, default=None, help='MB of memory a bot may use')
     args = parser.parse_args()
     log = True if args.log else False
     start = time.time()
-    myAuction = Auction("Test Strategy 2",number_of_rounds,starting_capital,100,0,type='max',log=log)
+    myAuction = Auction("Test Strategy 2",number_of_rounds,starting_capital,100,0,type='max',log=log,seed=args.seed,event_log=args.event_log,workers=args.workers,checkpoint=args.checkpoint,contain_faults=args.contain,time_limit=args.time_limit,memory_limit=args.memory_limit and args.memory_limit*2**20)
     myAuction.simulate()
+    if args.timings:
+        myAuction.print_timings()
     end = time.time()
     print(f"Execution time: {end-start:0.3f}")
\ No newline at end of file
@@ -0,0 +1,189 @@
+import time
+import traceback
+import multiprocessing
+from multiprocessing.connection import wait
+import numpy as np
+from Strategy import StrategyBase, StrategyHelper, RoundHistory
+
+INVALID_BID = -1  # what StrategyHelper.is_valid_bid returns for a bid that is not a number
+
+
+def serve(connection, name, strategy_class, helper_args, seed_sequence, history):
+    # Worker process: hosts one strategy behind a StrategyHelper and answers bid requests until it receives None.
+    # The round history is the Auction's, mapped from shared memory; requests only say how many rounds it holds,
+    # plus the winning and second-highest bids of the round we last bid in.
+    history = RoundHistory.attach(history)
+    helper = StrategyHelper(name, strategy_class(), log=False, history=history, rng=np.random.default_rng(seed_sequence), **helper_args)
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        ticket, value, num_bidders, capital, rounds, result = request
+        helper.capital = capital
+        error = None
+        if result is not None and helper.has_round_callback:
+            # Our round's result, before the history takes it in, as Auction does
+            try:
+                helper.notify(*result)
+            except Exception:
+                error = traceback.format_exc()  # reported with this request's answer
+        history.sync(rounds)
+        wall, cpu = helper.wall_time.total, helper.cpu_time.total
+        invalid = None
+        if error:
+            bid = INVALID_BID
+        else:
+            try:
+                bid = helper.bid(value, num_bidders)
+                invalid = helper.invalid_bid()
+            except Exception:
+                bid, error = INVALID_BID, traceback.format_exc()
+        connection.send((ticket, bid, invalid, helper.wall_time.total - wall, helper.cpu_time.total - cpu, error))
+    connection.close()
+
+
+class StrategyWorker(StrategyBase):
+    '''
+    Stand-in for a strategy hosted in its own long-lived process, talking to it over a persistent pipe.
+    Requests are sent with submit() and answered asynchronously, so the bids of many workers can be gathered
+    together (see gather_bids). Workers read the round history from the shared RoundHistory given by `history`
+    (its descriptor()), so a request carries only the bid arguments, the number of rounds recorded and the result of
+    the round the worker last bid in.
+    '''
+
+    def __init__(self, name, strategy_class, helper_args, seed_sequence, history):
+        self.name = name
+        self.__args = (name, strategy_class, helper_args, seed_sequence, history)
+        self.connection = None
+        self.__process = None
+        self.__ticket = 0
+        self.__sent = 0  # ticket of the last request actually sent
+        self.__result = None  # (winning bid, second-highest bid) of the round of that request, once settled
+        self.bid = INVALID_BID  # answer to the last request, INVALID_BID until it arrives
+        self.waiting = False  # a request is outstanding, possibly from an earlier round (see behind)
+        self.answered = False  # the latest request has been answered
+        self.invalid = None  # repr of what make_bid returned on the latest request if it wasn't a number
+        self.times = []  # (wall ns, cpu ns) of every make_bid call answered since collect_bids last read them
+        self.failed = None  # why the worker stopped answering, if it did
+        self.error = None  # traceback if make_bid raised on the last request
+
+    def start(self):
+        self.connection, child = multiprocessing.Pipe()
+        self.__process = multiprocessing.Process(target=serve, args=(child,) + self.__args, name=f"strategy-{self.name}", daemon=True)
+        self.__process.start()
+        child.close()
+
+    @property
+    def pid(self):
+        return self.__process.pid if self.__process is not None else None
+
+    @property
+    def behind(self):
+        # Still busy with a request from an earlier round, so it wasn't sent the latest one
+        return self.waiting and self.__sent != self.__ticket
+
+    def submit(self, value, num_bidders, capital, rounds):
+        if self.__process is None:
+            self.start()
+        self.__ticket += 1
+        self.bid = INVALID_BID
+        self.answered = False
+        self.invalid = self.error = None
+        if self.failed or self.waiting:
+            return  # a worker still busy gets no new request until it answers, so its backlog can't grow
+        try:
+            self.connection.send((self.__ticket, value, num_bidders, capital, rounds, self.__result))
+        except (OSError, ValueError) as error:
+            self.__fail(f"worker pipe closed ({error!r})")
+            return
+        self.__sent = self.__ticket
+        self.__result = None
+        self.waiting = True
+
+    def receive(self):
+        # Reads the reply to the outstanding request (or finds the worker gone)
+        try:
+            ticket, bid, invalid, wall, cpu, error = self.connection.recv()
+        except (EOFError, OSError) as error:
+            self.__fail(f"worker exited ({error!r})")
+            return
+        if error and not self.failed:
+            print(f"{self.name} raised an exception in its worker; that bid counts as invalid.\n{error}")
+        self.times.append((wall, cpu))
+        self.waiting = False
+        if ticket == self.__ticket:  # otherwise a late answer to an earlier round; this round's bid stays INVALID_BID
+            self.bid = bid
+            self.invalid = invalid
+            self.error = error
+            self.answered = True
+
+    def on_round_result(self, winning_bid, second_bid, my_outcome):
+        # Kept for the next request when this round's request went out, so the worker's callback gets the result of
+        # the round it bid in even if it answered late
+        if self.__sent == self.__ticket:
+            self.__result = (winning_bid, second_bid)
+
+    def __fail(self, reason):
+        if not self.failed:
+            print(f"{self.name}: {reason}; its bids count as invalid from now on.")
+        self.failed = reason
+        self.waiting = False
+
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        # Synchronous round trip, for use through StrategyHelper.bid; the worker reads the history itself
+        self.submit(current_value, num_bidders, capital, previous_winners.buffer.appended)
+        gather_bids([self])
+        return self.bid
+
+    def close(self, timeout=1):
+        if self.__process is None:
+            return
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        self.__process.join(timeout)
+        if self.__process.is_alive():
+            self.__process.terminate()
+            self.__process.join()
+        self.connection.close()
+        self.__process = None
+
+
+def gather_bids(workers, timeout=None):
+    '''
+    Waits for the answers to the workers' latest requests for at most `timeout` seconds (None waits forever).
+    Workers that miss the deadline, crash or raise keep bid INVALID_BID for this round. Workers that are behind
+    aren't waited for, but a late answer arriving meanwhile frees them for the next round.
+    '''
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pending = {worker.connection: worker for worker in workers if worker.waiting and not worker.behind}
+    behind = {worker.connection: worker for worker in workers if worker.behind}
+    while pending:
+        ready = wait(list(pending) + list(behind), None if deadline is None else max(0, deadline - time.monotonic()))
+        if not ready:
+            break
+        for connection in ready:
+            (pending.pop(connection, None) or behind.pop(connection)).receive()
+    for connection, worker in behind.items():
+        if connection.poll():
+            worker.receive()
+    return [worker.bid for worker in workers]
+
+
+def collect_bids(helpers, values, num_bidders, rounds, timeout=None):
+    # Sends every bid request before waiting on any, so the workers compute their bids concurrently
+    workers = [helper.strategy for helper in helpers]
+    for helper, value in zip(helpers, values):
+        helper.strategy.submit(value, num_bidders, helper.capital, rounds)
+    gather_bids(workers, timeout)
+    for helper, value in zip(helpers, values):
+        helper.value = value
+        helper.bid_value = helper.strategy.bid
+        for wall, cpu in helper.strategy.times:  # late answers to earlier rounds included
+            helper.wall_time.record(wall)
+            helper.cpu_time.record(cpu)
+        if helper.strategy.times and not helper.strategy.waiting:
+            helper.last_call = helper.strategy.times[-1][0]
+        helper.strategy.times.clear()
+    return tuple(helper.bid_value for helper in helpers)
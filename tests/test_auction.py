@@ -0,0 +1,125 @@
+import numpy as np
+from Auction import Auction
+from Strategy import StrategyBase
+
+
+class RandomBot(StrategyBase):
+    # Bids a random share of its value from its own stream
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return current_value * self.rng.uniform(0.3, 0.9)
+
+
+class GlobalRandomBot(StrategyBase):
+    # Still draws from numpy's global state, as older submissions do
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return current_value * np.random.uniform(0.3, 0.9)
+
+
+def run(strategies, seed, round_count=80, **kwargs):
+    auction = Auction(strategies, round_count, 300, 100, 0.3, seed=seed, verbose=False, **kwargs)
+    auction.simulate()
+    return auction.final_profits
+
+
+def test_seeded_runs_repeat():
+    assert run('Test Strategy 1', 1) == run('Test Strategy 1', 1)
+    assert run('Test Strategy 1', 1) != run('Test Strategy 1', 2)
+
+
+def test_strategies_get_independent_streams():
+    auction = Auction([('A', RandomBot), ('B', RandomBot)], 5, 300, 100, 0.3, seed=0, verbose=False)
+    shares = np.array([record.bids / np.maximum(record.values, 1) for record in auction.iter_rounds()])
+    assert not np.array_equal(shares[:, 0], shares[:, 1])
+
+
+def test_global_random_state_is_seeded():
+    bots = [('A', GlobalRandomBot), ('B', GlobalRandomBot)]
+    assert run(bots, 3) == run(bots, 3)
+
+
+def test_prefetch_draws_the_same_values_while_everyone_bids():
+    # With every bot alive the value matrix holds exactly the values drawn round by round
+    values = []
+    for prefetch_values in (False, True):
+        auction = Auction('Test Strategy 1', 100, 1e9, 100, 0.3, seed=2, verbose=False, prefetch_values=prefetch_values)
+        values.append([record.values.tolist() for record in auction.iter_rounds()])
+    assert values[0] == values[1]
+
+
+def test_prefetch_skips_values_of_dead_bots():
+    auction = Auction('Test Strategy 1', 300, 50, 100, 1.0, seed=5, verbose=False, prefetch_values=True)
+    for record in auction.iter_rounds():
+        assert len(record.values) == len(record.active)
+        assert all(0 <= value <= 100 and value == int(value) for value in record.values)
+    assert run('Test Strategy 1', 5, 300, prefetch_values=True) == run('Test Strategy 1', 5, 300, prefetch_values=True)
+
+
+class CountingBot(RandomBot):
+    calls = 0
+
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        CountingBot.calls += 1
+        return super().make_bid(current_value, previous_winners, previous_second_highest_bids, capital, num_bidders)
+
+
+def test_construction_runs_no_rounds():
+    CountingBot.calls = 0
+    auction = Auction([('A', CountingBot), ('B', CountingBot)], 50, 300, 100, 0.3, seed=0, verbose=False)
+    assert CountingBot.calls == 0 and auction.round_number == 0
+    assert auction.capitals.tolist() == [300.0, 300.0]
+
+
+def test_iter_rounds_can_stop_and_continue():
+    expected = run('Test Strategy 1', 6, 120)
+    auction = Auction('Test Strategy 1', 120, 300, 100, 0.3, seed=6, verbose=False)
+    records = []
+    for record in auction.iter_rounds():
+        records.append(record)
+        if record.round == 40:
+            break
+    assert auction.round_number == 40
+    records += list(auction.iter_rounds())
+    assert [record.round for record in records] == list(range(1, 121))
+    for record in records:
+        assert record.winning_bid == record.bids.max()
+        assert len(record.active) == len(record.values) == len(record.bids)
+    assert (records[-1].capitals - 300).tolist() == expected
+    auction.simulate()  # nothing left to run; only reports
+    assert auction.final_profits == expected
+
+
+class AllInBot(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return capital
+
+
+class HalfValueBot(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return current_value * 0.5
+
+
+def test_lone_survivor_settles_like_a_full_round(capsys):
+    bots = [('Half', HalfValueBot), ('AllIn1', AllInBot), ('AllIn2', AllInBot)]
+    profits = []
+    for log in (False, True):  # a logged run settles every round in full
+        auction = Auction(bots, 150, 100, 100, 0.3, seed=2, log=log, verbose=False)
+        records = list(auction.iter_rounds())
+        profits.append(auction.final_profits)
+    capsys.readouterr()
+    assert profits[0] == profits[1]
+    assert len(records[-1].active) == 1
+
+
+def test_run_completes_when_everyone_is_broke():
+    auction = Auction([('A', AllInBot), ('B', AllInBot)], 200, 50, 100, 0.3, seed=0, verbose=False)
+    auction.simulate()
+    assert auction.status == 'completed' and auction.round_number == 200
+    assert auction.final_profits == [-50.0, -50.0]
+
+
+def test_active_bots_are_those_with_capital():
+    auction = Auction('Test Strategy 1', 300, 100, 100, 1.0, seed=5, verbose=False)
+    records = list(auction.iter_rounds())
+    assert len(records[-1].active) < len(auction.names)  # some bots went broke
+    for before, record in zip(records, records[1:]):
+        assert record.active.tolist() == np.flatnonzero(before.capitals > 0).tolist()
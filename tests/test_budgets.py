@@ -0,0 +1,59 @@
+import time
+import numpy as np
+import pytest
+from Auction import Auction
+from Strategy import StrategyBase
+
+
+class Good(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return current_value * 0.7
+
+
+class Slow(Good):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        time.sleep(0.005)
+        return super().make_bid(current_value, previous_winners, previous_second_highest_bids, capital, num_bidders)
+
+
+class Hung(Good):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        if len(previous_winners) == 2:
+            time.sleep(30)
+        return super().make_bid(current_value, previous_winners, previous_second_highest_bids, capital, num_bidders)
+
+
+class Hog(Good):
+    # Holds on to 64 MB from its third bid on
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        if len(previous_winners) == 2:
+            self.hoard = np.ones(2**23)
+        return super().make_bid(current_value, previous_winners, previous_second_highest_bids, capital, num_bidders)
+
+
+def budgeted(bots, **kwargs):
+    auction = Auction(bots, 20, 500, 100, 0.3, seed=1, verbose=False, contain_faults=True, **kwargs)
+    records = list(auction.iter_rounds())
+    return auction, records
+
+
+def test_slow_bids_are_thrown_out_then_disqualified():
+    auction, records = budgeted([('Good', Good), ('Slow', Slow)], time_limit=0.001)
+    assert [(failure.round, failure.bot, failure.kind) for failure in auction.failures] == [(3, 'Slow', 'time limit')]
+    assert [record.bids[1] for record in records[:2]] == [-2, -2]
+    assert auction.disqualified.tolist() == [False, True]
+
+
+def test_hung_worker_is_disqualified():
+    start = time.monotonic()
+    auction, _ = budgeted([('Good', Good), ('Hung', Hung)], workers=True, deadline=0.05, time_limit=0.01)
+    assert [(failure.round, failure.bot, failure.kind) for failure in auction.failures] == [(5, 'Hung', 'time limit')]
+    assert 'deadline' in auction.failures[0].detail
+    assert auction.status == 'completed' and time.monotonic() - start < 10
+
+
+@pytest.mark.parametrize('workers', [False, True])
+def test_memory_limit_counts_what_the_bot_adds(workers):
+    auction, _ = budgeted([('Good', Good), ('Hog', Hog), ('Other', Good)], workers=workers, memory_limit=32 * 2**20, memory_check_interval=5)
+    assert [(failure.round, failure.bot, failure.kind) for failure in auction.failures] == [(5, 'Hog', 'memory limit')]
+    assert auction.disqualified.tolist() == [False, True, False]
@@ -0,0 +1,26 @@
+import random
+import numpy as np
+import pytest
+from Auction import Auction
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    path = str(tmp_path / 'auction.ckpt')
+    auction = Auction('Test Strategy 1', 300, 500, 100, 0.3, seed=9, verbose=False, checkpoint=path, checkpoint_interval=1e9)
+    rounds = auction.iter_rounds()
+    for _ in range(120):
+        next(rounds)
+    auction.save_checkpoint()
+    for _ in rounds:
+        pass
+    random.seed(123)  # the checkpoint must bring back the global random states too
+    np.random.seed(5)
+    resumed = Auction.resume(path)
+    assert resumed.round_number == 120
+    resumed.simulate()
+    assert resumed.final_profits == auction.final_profits
+
+
+def test_worker_auctions_cannot_be_checkpointed(tmp_path):
+    with pytest.raises(ValueError, match="can't be checkpointed"):
+        Auction('Test Strategy 1', 10, 500, 100, 0.3, verbose=False, workers=True, checkpoint=str(tmp_path / 'auction.ckpt'))
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from Auction import Auction
+from Distributions import DISTRIBUTIONS, Empirical, get_distribution
+
+
+@pytest.mark.parametrize('name', [name for name in DISTRIBUTIONS if name != 'empirical'])
+def test_named_distributions_sample_in_range(name):
+    distribution = get_distribution(name, 100)
+    values = distribution.sample(np.random.default_rng(0), (50, 6))
+    assert values.shape == (50, 6)
+    assert values.min() >= 0 and values.max() <= 100
+
+
+def test_uniform_is_the_original_randint():
+    values = get_distribution('uniform', 100).sample(np.random.default_rng(0), 1000)
+    assert values.dtype.kind == 'i' and set(values.tolist()) <= set(range(101))
+
+
+def test_common_value_is_shared_within_a_round():
+    values = get_distribution('common', 100, private_std=0).sample(np.random.default_rng(0), (20, 5))
+    assert np.all(values == values[:, :1])
+
+
+def test_empirical_by_name(tmp_path):
+    path = tmp_path / 'values.csv'
+    path.write_text('10,20,30\n40,50,60\n')
+    distribution = get_distribution(f'empirical:{path}', 100)
+    assert isinstance(distribution, Empirical)
+    assert set(distribution.sample(np.random.default_rng(0), 200).tolist()) <= {10, 20, 30, 40, 50, 60}
+    auction = Auction('Test Strategy 1', 20, 500, 100, 0.3, seed=0, verbose=False, distribution=f'empirical:{path}')
+    assert all(set(record.values.tolist()) <= {10, 20, 30, 40, 50, 60} for record in auction.iter_rounds())
+
+
+def test_empirical_without_data_is_a_clear_error():
+    with pytest.raises(ValueError, match='empirical:<path'):
+        get_distribution('empirical', 100)
+    with pytest.raises(ValueError, match='Unknown distribution'):
+        get_distribution('gamma', 100)
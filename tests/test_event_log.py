@@ -0,0 +1,29 @@
+import numpy as np
+from Auction import Auction
+from EventLog import read_event_log
+
+
+def test_event_log_survives_restart(tmp_path):
+    path = str(tmp_path / 'auction.log')
+    auction = Auction('Test Strategy 1', 40, 500, 100, 0.3, seed=7, verbose=False, event_log=path)
+    for record in auction.iter_rounds():
+        if record.round == 10:
+            break
+    auction.simulate()
+    _, tape = read_event_log(path)
+    assert tape['round'].tolist() == list(range(1, 41))
+
+
+def test_event_log_matches_round_records(tmp_path):
+    path = str(tmp_path / 'auction.log')
+    auction = Auction('Test Strategy 1', 60, 300, 100, 0.3, seed=2, verbose=False, event_log=path)
+    records = list(auction.iter_rounds())
+    header, tape = read_event_log(path)
+    assert header['names'] == auction.names
+    assert tape['round'].tolist() == [record.round for record in records]
+    for row, record in enumerate(records):
+        assert tape['values'][row, record.active].tolist() == record.values.tolist()
+        assert tape['bids'][row, record.active].tolist() == record.bids.tolist()
+        assert tape['capitals'][row].tolist() == record.capitals.tolist()
+        assert (tape['winning_bid'][row], tape['second_highest'][row]) == (record.winning_bid, record.second_highest)
+        assert np.isnan(np.delete(tape['bids'][row], record.active)).all()
@@ -0,0 +1,105 @@
+import time
+import numpy as np
+import pytest
+from Auction import Auction
+from Strategy import StrategyBase
+
+
+class Good(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return current_value * 0.7
+
+
+class Raiser(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        if len(previous_winners) == 5:
+            raise ZeroDivisionError('bad')
+        return current_value * 0.8
+
+
+class NoneBot(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return None if len(previous_winners) == 9 else current_value * 0.5
+
+
+class NanBot(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return float('nan') if len(previous_winners) == 12 else current_value * 0.6
+
+
+class NumpyBot(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return np.int64(current_value // 2) if len(previous_winners) % 2 else np.float32(current_value * 0.4)
+
+
+class FloatBot(NumpyBot):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return float(super().make_bid(current_value, previous_winners, previous_second_highest_bids, capital, num_bidders))
+
+
+class MinusOneBot(StrategyBase):
+    # -1 is a number, only out of range: thrown out for the round, not a fault
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return -1 if len(previous_winners) == 2 else current_value * 0.3
+
+
+class CallbackRaiser(Good):
+    def on_round_result(self, winning_bid, second_bid, my_outcome):
+        if my_outcome.won:
+            raise ValueError('callback')
+
+
+class ConstructorRaiser(Good):
+    def __init__(self):
+        raise KeyError('constructor')
+
+
+class SlowOnce(Good):
+    def __init__(self):
+        self.calls = 0
+
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        self.calls += 1
+        if self.calls == 3:
+            time.sleep(0.05)
+        return super().make_bid(current_value, previous_winners, previous_second_highest_bids, capital, num_bidders)
+
+
+def contained(bots, round_count=40, **kwargs):
+    auction = Auction(bots, round_count, 500, 100, 0.3, seed=1, verbose=False, contain_faults=True, **kwargs)
+    auction.simulate()
+    return auction
+
+
+@pytest.mark.parametrize('workers', [False, True])
+def test_broken_bots_are_disqualified(workers):
+    auction = contained([('Good', Good), ('Raiser', Raiser), ('NoneBot', NoneBot), ('NanBot', NanBot), ('Numpy', NumpyBot), ('MinusOne', MinusOneBot)], workers=workers)
+    assert auction.status == 'completed' and auction.round_number == 40
+    failures = [(failure.round, failure.bot, failure.kind) for failure in auction.failures]
+    assert failures == [(6, 'Raiser', 'worker' if workers else 'exception'), (10, 'NoneBot', 'invalid bid'), (13, 'NanBot', 'invalid bid')]
+    assert [failure.detail for failure in auction.failures[1:]] == ['None', 'nan']
+    assert 'ZeroDivisionError' in auction.failures[0].detail
+    assert auction.disqualified.tolist() == [False, True, True, True, False, False]
+
+
+def test_numpy_bids_count_like_floats():
+    profits = []
+    for bot in (NumpyBot, FloatBot):
+        auction = contained([('Good', Good), ('Bot', bot)])
+        profits.append(auction.final_profits)
+        assert not auction.failures
+    assert profits[0] == profits[1]
+
+
+def test_callback_and_constructor_exceptions_are_contained():
+    auction = contained([('Good', Good), ('Callback', CallbackRaiser), ('Constructor', ConstructorRaiser)])
+    assert auction.status == 'completed'
+    assert [(failure.bot, failure.kind) for failure in auction.failures] == [('Constructor', 'exception'), ('Callback', 'exception')]
+    assert auction.failures[0].round == 0 and 'KeyError' in auction.failures[0].detail
+    assert 'ValueError' in auction.failures[1].detail
+    assert auction.disqualified.tolist() == [False, True, True]
+
+
+def test_late_worker_answer_is_not_a_fault():
+    auction = contained([('Good', Good), ('Slow', SlowOnce), ('Other', Good)], 1000, workers=True, deadline=0.01)
+    assert not auction.failures and not auction.disqualified.any()
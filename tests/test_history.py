@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from Strategy import RingBuffer, RoundHistory
+
+
+def test_ring_buffer_window_matches_list():
+    rng = np.random.default_rng(0)
+    buffer, entries = RingBuffer(16), []
+    for value in rng.uniform(0, 100, 100):
+        buffer.append(value)
+        entries.append(value)
+        assert buffer.window().tolist() == entries[-16:]
+        assert buffer.window(5).tolist() == entries[-16:][-5:]
+
+
+def test_ring_buffer_rows_match_lists():
+    rng = np.random.default_rng(1)
+    buffer, entries = RingBuffer(8, width=3), []
+    for row in rng.uniform(0, 100, (30, 3)):
+        buffer.append(row)
+        entries.append(row)
+        assert np.array_equal(buffer.window(), np.array(entries[-8:]).T)
+
+
+def test_history_view_acts_like_a_list():
+    history, winners = RoundHistory(10), []
+    view = history.view('winners', 4)
+    assert not view and len(view) == 0 and view.tolist() == []
+    for value in np.arange(1.0, 8.0):
+        history.record(value, value / 2)
+        winners.append(value)
+    assert len(view) == 4
+    assert view[-1] == 7.0 and view[0] == 4.0
+    assert view[1:3] == winners[-4:][1:3]
+    assert list(view) == winners[-4:]
+    assert np.mean(view) == np.mean(winners[-4:])
+
+
+def test_rolling_stats_match_numpy():
+    rng = np.random.default_rng(2)
+    buffer, entries = RingBuffer(20), []
+    samples = rng.uniform(0, 100, 300)
+    samples[rng.random(300) < 0.05] = float('-inf')  # second-highest bid of a round nobody came second in
+    for value in samples:
+        buffer.append(value)
+        entries.append(value)
+        window = np.array(entries[-20:])
+        stats = buffer.stats
+        with np.errstate(invalid='ignore'):
+            assert stats.mean() == pytest.approx(window.mean(), rel=1e-9, nan_ok=True)
+            assert stats.var() == pytest.approx(window.var(), rel=1e-9, abs=1e-9, nan_ok=True)
+        assert stats.min() == window.min()
+        assert stats.max() == window.max()
+        for q in (0, 0.1, 0.5, 0.9, 1):
+            quantile = stats.quantile(q)
+            assert window.min() <= quantile <= window.max()
+            if np.isfinite(window).all():
+                assert quantile == pytest.approx(np.quantile(window, q), abs=100 / 256)
+
+
+def test_quantile_stays_in_sparse_windows():
+    buffer = RingBuffer(20)
+    for _ in range(5):
+        buffer.append(50.0)
+    assert [buffer.stats.quantile(q) for q in (0, 0.3, 0.5, 1)] == [50.0] * 4
+    buffer = RingBuffer(20)
+    for value in (10.0, 80.0):
+        buffer.append(value)
+    for q in (0, 0.25, 0.5, 1):
+        assert buffer.stats.quantile(q) == pytest.approx(np.quantile([10.0, 80.0], q), abs=0.5)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from Auction import Auction
+from MultiAuction import MultiAuction
+from Strategy import StrategyBase
+
+
+class AllIn(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return 100
+
+
+class Illegal(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return -5
+
+
+class Plain(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return 0.5 * current_value
+
+
+class Overbidder(StrategyBase):
+    # Pays more than its values, so it goes broke at a different round in every auction; counts its calls per row
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return min(current_value + 20, capital)
+
+    def make_bids_batch(self, current_values, previous_winners, previous_second_highest_bids, capitals, num_bidders):
+        if not hasattr(self, 'calls'):
+            self.calls = np.zeros(len(current_values), dtype=int)
+        self.calls += 1
+        self.rows = len(current_values)
+        return np.minimum(current_values + 20, capitals)
+
+
+@pytest.mark.parametrize('folder, round_count, capital, fraction, type, seed', [
+    ('Test Strategy 1', 200, 500, 0, 'self', 1), ('Test Strategy 1', 200, 200, 0.5, 'max', 2), ('Test Strategy 1', 300, 50, 1.0, 'self', 5)])
+def test_single_auction_matches_auction(folder, round_count, capital, fraction, type, seed):
+    auction = Auction(folder, round_count, capital, 100, fraction, type=type, seed=seed, verbose=False, prefetch_values=True)
+    auction.simulate()
+    multi = MultiAuction(folder, 1, round_count, capital, 100, fraction, type=type, seed=seed, verbose=False)
+    multi.simulate()
+    assert multi.final_profits[0].tolist() == auction.final_profits
+
+
+def test_batch_rows_stay_aligned_with_auctions():
+    multi = MultiAuction([('Over', Overbidder), ('Plain1', Plain), ('Plain2', Plain)], 8, 200, 300, 100, 0, seed=1, verbose=False)
+    multi.simulate()
+    bot = multi.strategies[0][0].strategy
+    assert (multi.capitals[:, 0] == 0).any()
+    assert bot.rows == 8 and bot.calls.tolist() == [200] * 8
+
+
+def test_broke_auctions_are_frozen():
+    multi = MultiAuction([('A', AllIn), ('B', AllIn)], 3, 200, 50, 100, 0.3, seed=0, verbose=False)
+    multi.simulate()
+    assert multi.round_number == 200
+    assert multi.final_profits.tolist() == [[-50.0, -50.0]] * 3
+    auction = Auction([('A', AllIn), ('B', AllIn)], 200, 50, 100, 0.3, seed=0, verbose=False, prefetch_values=True)
+    auction.simulate()
+    single = MultiAuction([('A', AllIn), ('B', AllIn)], 1, 200, 50, 100, 0.3, seed=0, verbose=False)
+    single.simulate()
+    assert single.final_profits[0].tolist() == auction.final_profits
+
+
+def test_illegal_bids_still_abort():
+    multi = MultiAuction([('A', Illegal), ('B', Illegal)], 2, 10, 50, 100, 0.3, seed=0, verbose=False)
+    with pytest.raises(SystemExit):
+        multi.simulate()
@@ -0,0 +1,19 @@
+import pytest
+from Auction import Auction, load_strategy_class
+from Replay import Replay
+
+
+def test_replay_reproduces_run(tmp_path):
+    path = str(tmp_path / 'auction.log')
+    auction = Auction('Test Strategy 1', 200, 500, 100, 0.3, seed=4, verbose=False, event_log=path)
+    auction.simulate()
+    replay = Replay(path, 'Bot3', load_strategy_class('Test Strategy 1', 'Bot3')[0], verbose=False)
+    replay.simulate()
+    assert replay.final_profits == auction.final_profits
+
+
+def test_replay_needs_a_bot_from_the_log(tmp_path):
+    path = str(tmp_path / 'auction.log')
+    Auction('Test Strategy 1', 10, 500, 100, 0.3, seed=4, verbose=False, event_log=path).simulate()
+    with pytest.raises(ValueError, match='Nobody is not in'):
+        Replay(path, 'Nobody', load_strategy_class('Test Strategy 1', 'Bot3')[0], verbose=False)
@@ -0,0 +1,54 @@
+import os
+import shutil
+from Distributions import Uniform
+from ResultCache import ResultCache, run_cached
+
+ARGS = dict(round_count=40, starting_capital=500, max_value=100, second_highest_fraction=0.3)
+
+
+def test_second_run_is_read_back(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache'))
+    first = run_cached('Test Strategy 1', 3, ARGS, cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert run_cached('Test Strategy 1', 3, ARGS, cache) == first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.stats()[0] == 1
+
+
+def test_key_follows_sources_parameters_and_data(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache'))
+    folder = str(tmp_path / 'strategies')
+    shutil.copytree('Test Strategy 1', folder, ignore=shutil.ignore_patterns('__pycache__'))
+    key = cache.key(folder, 1, ARGS)
+    assert cache.key(folder, 1, dict(ARGS)) == key
+    assert cache.key(folder, 2, ARGS) != key
+    assert cache.key(folder, 1, dict(ARGS, type='max')) != key
+    with open(os.path.join(folder, sorted(os.listdir(folder))[0]), 'a') as file:
+        file.write('\n# edited\n')
+    assert cache.key(folder, 1, ARGS) != key
+    data = tmp_path / 'values.txt'
+    data.write_text('10\n20\n30\n')
+    empirical = dict(ARGS, distribution=f'empirical:{data}')
+    key = cache.key(folder, 1, empirical)
+    data.write_text('10\n20\n40\n')
+    assert cache.key(folder, 1, empirical) != key
+
+
+def test_uncacheable_runs_have_no_key(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache'))
+    assert cache.key('Test Strategy 1', None, ARGS) is None
+    assert cache.key('Test Strategy 1', 1, dict(ARGS, time_limit=0.01)) is None
+    assert cache.key('Test Strategy 1', 1, dict(ARGS, distribution=Uniform(100))) is None
+    assert cache.key('Test Strategy 1', 1, dict(ARGS, distribution=f"empirical:{tmp_path / 'missing.txt'}")) is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache'), max_bytes=10**6)
+    keys = [f'{i:02x}' * 32 for i in range(6)]
+    for i, key in enumerate(keys):
+        cache.put(key, {'payload': 'x' * 1000})
+        path = os.path.join(cache.directory, key[:2], f'{key}.json')
+        os.utime(path, (1000 + i, 1000 + i))
+    cache.get(keys[0])  # used again, so it is now the newest
+    cache.evict(3500)  # room for three entries
+    assert [cache.get(key) is not None for key in keys] == [True, False, False, False, True, True]
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from Auction import Auction
+from EventLog import read_event_log
+from Settlement import top_two, settle
+
+
+def old_find_two_highest(nums):
+    # Auction.find_two_highest before settlement was vectorized
+    first, second = float('-inf'), float('-inf')
+    for num in nums:
+        if num > first:
+            first, second = num, first
+        elif num > second and num != first:
+            second = num
+    return first, second
+
+
+def old_settle(capitals, active, values, bids, second_highest_fraction, type, epsilon=0.01):
+    # The per-bot settlement loop of Auction.run_auction / StrategyHelper.update_capital before user-003
+    winning_bid, second_highest = old_find_two_highest(bids)
+    max_value = max(values)
+    for i, value, bid in zip(active, values, bids):
+        winning_value = max_value if type == 'max' else value
+        capital = capitals[i]
+        if abs(bid - winning_bid) < epsilon:
+            capitals[i] += winning_value - winning_bid
+        elif abs(bid - second_highest) < epsilon:
+            capitals[i] -= min(capitals[i], second_highest_fraction * max(0, winning_value - winning_bid))
+        if capital > 0 and capitals[i] <= 0:
+            capitals[i] = 0
+    return winning_bid, second_highest
+
+
+@pytest.mark.parametrize('type', ['self', 'max'])
+@pytest.mark.parametrize('second_highest_fraction', [0, 0.3, 1.0])
+def test_settle_matches_old_loop(type, second_highest_fraction):
+    rng = np.random.default_rng(3)
+    bots, rounds = 7, 400
+    values = rng.integers(0, 101, (rounds, bots))
+    # Whole-number bids plus sub-epsilon offsets make exact and near ties for first and second place common;
+    # -2 is the code for an out-of-range bid
+    bids = np.floor(values * rng.uniform(0.3, 1.1, (rounds, bots))) + 0.006 * rng.integers(0, 3, (rounds, bots))
+    bids[rng.random((rounds, bots)) < 0.05] = -2
+    expected = [60.0] * bots
+    capitals = np.full(bots, 60.0)
+    for row in range(rounds):
+        active = np.flatnonzero(capitals > 0)
+        if not len(active):
+            break
+        round_bids = np.minimum(bids[row, active], capitals[active])
+        winning_bid, second_highest = old_settle(expected, active, values[row, active].tolist(), round_bids.tolist(), second_highest_fraction, type)
+        if winning_bid < 0:
+            break
+        assert top_two(round_bids) == (winning_bid, second_highest)
+        settled = capitals[active]
+        settle(settled, round_bids, values[row, active].astype(float), winning_bid, second_highest, second_highest_fraction, type)
+        capitals[active] = settled
+        assert capitals.tolist() == expected
+
+
+@pytest.mark.parametrize('folder, type, second_highest_fraction', [('Test Strategy 1', 'self', 0.3), ('Test Strategy 1', 'max', 0.5), ('Test Strategy 3', 'max', 0)])
+def test_auction_matches_old_loop(tmp_path, folder, type, second_highest_fraction):
+    # Every round an Auction settled, re-settled with the old loop from the values and bids on its event log
+    path = tmp_path / 'auction.log'
+    auction = Auction(folder, 150, 200, 100, second_highest_fraction, type=type, seed=11, verbose=False, event_log=str(path))
+    auction.simulate()
+    header, tape = read_event_log(path)
+    expected = [float(header['starting_capital'])] * len(header['names'])
+    for row in range(len(tape['round'])):
+        active = np.flatnonzero(~np.isnan(tape['values'][row]))
+        old_settle(expected, active, tape['values'][row, active].tolist(), tape['bids'][row, active].tolist(), second_highest_fraction, type)
+        assert tape['capitals'][row].tolist() == expected
+    assert auction.final_profits == [capital - 200 for capital in expected]
@@ -0,0 +1,64 @@
+import numpy as np
+from Auction import Auction
+from Strategy import StrategyBase, StrategyHelper
+
+
+class HalfBot(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return current_value * 0.5 + len(previous_winners) % 3
+
+
+class BatchHalfBot(HalfBot):
+    def make_bids_batch(self, current_values, previous_winners, previous_second_highest_bids, capitals, num_bidders):
+        return current_values * 0.5 + previous_winners.shape[1] % 3
+
+
+class EchoBot(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return current_value
+
+    def make_bids_batch(self, current_values, previous_winners, previous_second_highest_bids, capitals, num_bidders):
+        return current_values
+
+
+def test_batch_hook_is_used_in_a_single_auction():
+    profits = []
+    for bot in (HalfBot, BatchHalfBot):
+        auction = Auction([('Half', bot), ('Other', HalfBot)], 120, 300, 100, 0.3, seed=1, verbose=False)
+        auction.simulate()
+        profits.append(auction.final_profits)
+    assert profits[0] == profits[1]
+
+
+def test_batch_bids_are_validated_like_single_bids():
+    helper = StrategyHelper('Echo', EchoBot(), 100, 100, log=False)
+    bids = helper.bid_batch(np.array([-1.0, 150.0, 30.0, 40.0]), np.zeros((4, 0)), np.zeros((4, 0)), np.array([100.0, 100.0, 20.0, 100.0]), np.full(4, 3))
+    assert bids.tolist() == [-2, -2, 20.0, 40.0]  # out of range, out of range, capped at capital, as bid
+
+
+class Recorder(HalfBot):
+    # Keeps every round result it is told about next to the history it is shown
+    instances = []
+
+    def __init__(self):
+        self.results, self.shown = [], []
+        Recorder.instances.append(self)
+
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        self.shown.append((list(previous_winners[-1:]), list(previous_second_highest_bids[-1:]), capital))
+        return super().make_bid(current_value, previous_winners, previous_second_highest_bids, capital, num_bidders)
+
+    def on_round_result(self, winning_bid, second_bid, my_outcome):
+        self.results.append((winning_bid, second_bid, my_outcome))
+
+
+def test_round_results_match_the_history():
+    auction = Auction([('Recorder', Recorder), ('Half', HalfBot), ('Echo', EchoBot)], 60, 300, 100, 0.3, seed=3, verbose=False)
+    auction.simulate()
+    bot = Recorder.instances[-1]
+    assert len(bot.results) == len(bot.shown) == 60
+    for (winning_bid, second_bid, outcome), (winners, seconds, capital) in zip(bot.results, bot.shown[1:]):
+        assert [winning_bid] == winners and [second_bid] == seconds
+        assert outcome.capital == capital
+        assert outcome.won == (outcome.bid == winning_bid) and not (outcome.won and outcome.second)
+    assert any(outcome.second for _, _, outcome in bot.results)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from Auction import Auction
+from MultiAuction import MultiAuction
+from Strategy import LatencyHistogram
+
+
+def test_latency_quantiles_within_a_bucket():
+    rng = np.random.default_rng(0)
+    samples = rng.lognormal(10, 2, 5000).astype(int)
+    histogram = LatencyHistogram()
+    for ns in samples.tolist():
+        histogram.record(ns)
+    assert histogram.count == len(samples) and histogram.total == samples.sum() and histogram.max == samples.max()
+    ordered = np.sort(samples)
+    for q in (0, 0.5, 0.9, 0.99, 1):
+        exact = ordered[int(q * (len(samples) - 1))]
+        assert histogram.quantile(q) == pytest.approx(exact, rel=1 / 16, abs=1)
+
+
+def test_merged_histograms_match_one_histogram():
+    samples = np.random.default_rng(1).integers(0, 10**7, 1000).tolist()
+    whole, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i, ns in enumerate(samples):
+        whole.record(ns)
+        (first if i % 3 else second).record(ns)
+    merged = first.merge(second)
+    assert (merged.counts, merged.count, merged.total, merged.max) == (whole.counts, whole.count, whole.total, whole.max)
+
+
+def test_timing_report_counts_every_bid():
+    auction = Auction('Test Strategy 1', 50, 1000, 100, 0, seed=0, verbose=False)
+    auction.simulate()
+    report = auction.timings()
+    assert sorted(row['name'] for row in report) == sorted(auction.names)
+    assert [row['wall'] for row in report] == sorted((row['wall'] for row in report), reverse=True)
+    assert all(row['calls'] == 50 and row['p50'] <= row['p99'] <= row['max'] for row in report)
+    assert sum(row['share'] for row in report) <= 1
+    multi = MultiAuction('Test Strategy 1', 3, 20, 1000, 100, 0, seed=0, verbose=False)
+    multi.simulate()
+    assert len(multi.timings()) == len(multi.names)
@@ -0,0 +1,21 @@
+import numpy as np
+from Auction import Auction
+from Tournament import Tournament, summarize_profits
+
+
+def test_tournament_matches_single_auctions():
+    tournament = Tournament('Test Strategy 1', [3, 4, 5], 60, 200, 100, 0.3, workers=2)
+    summary = tournament.run()
+    for seed, profits in zip(tournament.seeds, tournament.profits):
+        auction = Auction('Test Strategy 1', 60, 200, 100, 0.3, seed=seed, verbose=False)
+        auction.simulate()
+        assert profits.tolist() == auction.final_profits
+    assert [result['name'] for result in summary] == tournament.names
+    assert not tournament.failures
+
+
+def test_summarize_profits():
+    profits = np.array([[1.0, 3.0], [2.0, 2.0]])
+    summary = summarize_profits(['a', 'b'], profits)
+    assert [result['mean'] for result in summary] == [1.5, 2.5]
+    assert [result['win_rate'] for result in summary] == [0.5, 1.0]  # ties count as wins for both
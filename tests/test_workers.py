@@ -0,0 +1,66 @@
+import os
+import json
+import time
+import numpy as np
+import pytest
+from Auction import Auction
+from Strategy import StrategyBase
+
+
+class StallingBot(StrategyBase):
+    # Stalls on its third bid for long enough to fall more than info_size rounds behind, logging what it sees
+    def __init__(self):
+        self.calls = 0
+
+    def log(self, *entry):
+        with open(os.environ['STALLING_BOT_LOG'], 'a') as file:
+            file.write(json.dumps(entry) + '\n')
+
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        self.calls += 1
+        bid = current_value * 0.5
+        self.log('bid', previous_winners.buffer.appended, list(previous_winners), previous_winners.stats.mean(), bid)
+        if self.calls == 3:
+            time.sleep(0.05)
+        return bid
+
+    def on_round_result(self, winning_bid, second_bid, my_outcome):
+        self.log('result', winning_bid, second_bid, my_outcome.bid)
+
+
+class SteadyBot(StrategyBase):
+    def make_bid(self, current_value, previous_winners, previous_second_highest_bids, capital, num_bidders):
+        return current_value * 0.6
+
+
+def test_workers_match_in_process():
+    results = []
+    for workers in (False, True):
+        auction = Auction('Test Strategy 1', 100, 500, 100, 0.3, seed=5, verbose=False, workers=workers, deadline=None)
+        auction.simulate()
+        results.append(auction.final_profits)
+    assert results[0] == results[1]
+
+
+def test_worker_far_behind_sees_the_right_rounds(tmp_path, monkeypatch):
+    monkeypatch.setenv('STALLING_BOT_LOG', str(tmp_path / 'bot.log'))
+    auction = Auction([('Stalling', StallingBot), ('A', SteadyBot), ('B', SteadyBot)], 1000, 10**6, 100, 0.3, seed=1, verbose=False,
+                      info_size=5, workers=True, deadline=0.005)
+    records = list(auction.iter_rounds())
+    winners = [record.winning_bid for record in records]
+    seconds = [record.second_highest for record in records]
+    log = [json.loads(line) for line in open(tmp_path / 'bot.log')]
+    bids = [entry for entry in log if entry[0] == 'bid']
+    assert any(later[1] - earlier[1] > 5 for earlier, later in zip(bids, bids[1:]))  # it did fall behind
+    last = None
+    for entry in log:
+        if entry[0] == 'bid':
+            _, rounds, window, mean, bid = entry
+            assert window == winners[max(0, rounds - 5):rounds]
+            if window:
+                assert mean == pytest.approx(np.mean(window))
+            last = (rounds, bid)
+        else:
+            _, winning_bid, second_bid, bid = entry
+            assert (winning_bid, second_bid, bid) == (winners[last[0]], seconds[last[0]], last[1])
+